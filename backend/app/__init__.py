@@ -1,15 +1,28 @@
+import orjson
 from flask import Flask
+from flask.json.provider import DefaultJSONProvider
 from flask_sqlalchemy import SQLAlchemy
 from flask_cors import CORS
 from flask_migrate import Migrate
 from flask_jwt_extended import JWTManager
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
+from flask_caching import Cache
 from config import config
 
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson for faster response serialization"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 db = SQLAlchemy()
 migrate = Migrate()
 jwt = JWTManager()
+cache = Cache()
 limiter = Limiter(
     key_func=get_remote_address,
     default_limits=["200 per day", "50 per hour"]
@@ -17,6 +30,7 @@ limiter = Limiter(
 
 def create_app(config_name='development'):
     app = Flask(__name__)
+    app.json = ORJSONProvider(app)
     app.config.from_object(config[config_name])
     
     # Initialize extensions
@@ -24,15 +38,22 @@ def create_app(config_name='development'):
     migrate.init_app(app, db)
     jwt.init_app(app)
     limiter.init_app(app)
+    cache.init_app(app)
     CORS(app)
     
+    # Bind the optional Celery worker to this app's config
+    from app.tasks import init_celery
+    init_celery(app)
+
     # Register blueprints
     from app.routes import analysis, health
     app.register_blueprint(analysis.bp)
     app.register_blueprint(health.bp)
     
-    # Create tables
-    with app.app_context():
-        db.create_all()
+    # Create tables in development; production relies on `flask db upgrade`
+    # so multi-worker boots don't race on CREATE TABLE IF NOT EXISTS
+    if app.config.get('AUTO_CREATE_TABLES'):
+        with app.app_context():
+            db.create_all()
     
     return app
@@ -1,7 +1,12 @@
 from datetime import datetime
+from sqlalchemy.dialects.postgresql import JSONB
 from app import db
 import json
 
+# Binary JSONB on PostgreSQL (indexable, no reparse on read), plain JSON
+# elsewhere (SQLite dev database)
+JSONVariant = db.JSON().with_variant(JSONB(), 'postgresql')
+
 class PhoneAnalysis(db.Model):
     __tablename__ = 'phone_analyses'
     
@@ -16,26 +21,36 @@ class PhoneAnalysis(db.Model):
     risk_level = db.Column(db.String(20))  # LOW, MEDIUM, HIGH, CRITICAL
     
     # OSINT Findings
-    social_media_presence = db.Column(db.JSON)
+    social_media_presence = db.Column(JSONVariant)
     spam_reports_count = db.Column(db.Integer, default=0)
     fraud_mentions_count = db.Column(db.Integer, default=0)
-    telegram_presence = db.Column(db.JSON)
-    whatsapp_presence = db.Column(db.JSON)
+    telegram_presence = db.Column(JSONVariant)
+    whatsapp_presence = db.Column(JSONVariant)
     
     # Rich Metadata (Enhanced)
-    rich_metadata = db.Column(db.JSON)  # Carrier history, geographic data, number status
+    rich_metadata = db.Column(JSONVariant)  # Carrier history, geographic data, number status
     
     # Metadata
     analysis_date = db.Column(db.DateTime, default=datetime.utcnow)
     analysis_duration = db.Column(db.Float)  # in seconds
-    data_sources_used = db.Column(db.JSON)
+    data_sources_used = db.Column(JSONVariant)
     
     # Relationships
-    risk_factors = db.relationship('RiskFactor', backref='analysis', lazy='dynamic', cascade='all, delete-orphan')
+    risk_factors = db.relationship('RiskFactor', backref='analysis', lazy='select', cascade='all, delete-orphan')
     
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    
+
+    # Indexes backing the hot queries:
+    # - /history ordering by analysis_date DESC
+    # - /analyze 24h lookup on (phone_number, analysis_date)
+    # - /search filtering on risk_level
+    __table_args__ = (
+        db.Index('ix_phone_analyses_date_desc', analysis_date.desc()),
+        db.Index('ix_phone_analyses_phone_date', 'phone_number', 'analysis_date'),
+        db.Index('ix_phone_analyses_risk_level', 'risk_level'),
+    )
+
     def to_dict(self):
         return {
             'id': self.id,
@@ -1,5 +1,6 @@
 from datetime import datetime
 from app import db
+from app.models.phone_analysis import JSONVariant
 
 class RiskFactor(db.Model):
     __tablename__ = 'risk_factors'
@@ -14,7 +15,7 @@ class RiskFactor(db.Model):
     score_contribution = db.Column(db.Float, default=0.0)
     
     description = db.Column(db.Text)
-    evidence = db.Column(db.JSON)  # Store evidence data
+    evidence = db.Column(JSONVariant)  # Store evidence data
     source = db.Column(db.String(200))  # Data source URL or name
     
     detected_at = db.Column(db.DateTime, default=datetime.utcnow)
@@ -31,7 +32,8 @@ class RiskFactor(db.Model):
             'description': self.description,
             'evidence': self.evidence or {},
             'source': self.source,
-            'detected_at': self.detected_at.isoformat() if self.detected_at else None
+            # Raw datetime - the orjson provider encodes it (and None) directly
+            'detected_at': self.detected_at
         }
     
     def __repr__(self):
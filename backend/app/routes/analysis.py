@@ -1,5 +1,7 @@
-from flask import Blueprint, request, jsonify
-from app import db, limiter
+import orjson
+from flask import Blueprint, request, jsonify, current_app, Response, stream_with_context
+from sqlalchemy import select, func, delete
+from app import db, limiter, cache
 from app.models.phone_analysis import PhoneAnalysis
 from app.services.phone_analyzer import PhoneAnalyzer
 from app.utils.validators import validate_phone_number
@@ -29,67 +31,64 @@ def analyze_phone():
         if not is_valid:
             return jsonify({'error': error_msg}), 400
         
-        # Check if recent analysis exists (within 24 hours)
-        from datetime import datetime, timedelta
-        recent_analysis = PhoneAnalysis.query.filter_by(
-            phone_number=phone_number
-        ).filter(
-            PhoneAnalysis.analysis_date > datetime.utcnow() - timedelta(hours=24)
-        ).first()
-        
-        if recent_analysis and not deep_scan:
-            return jsonify({
-                'message': 'Using cached analysis from last 24 hours',
-                'analysis': recent_analysis.to_dict()
-            }), 200
-        
+        # Check if recent analysis exists (within 24 hours): cache first,
+        # then fall back to the database (e.g. after a process restart)
+        cache_key = f"pa:{phone_number}"
+        if not deep_scan:
+            cached = cache.get(cache_key)
+            if cached:
+                return jsonify({
+                    'message': 'Using cached analysis from last 24 hours',
+                    'analysis': cached
+                }), 200
+
+            from datetime import datetime, timedelta
+            recent_analysis = db.session.scalar(
+                select(PhoneAnalysis).where(
+                    PhoneAnalysis.phone_number == phone_number,
+                    PhoneAnalysis.analysis_date > datetime.utcnow() - timedelta(hours=24)
+                ).limit(1)
+            )
+
+            if recent_analysis:
+                payload = recent_analysis.to_dict()
+                # Cache only for the rest of the 24h window - a full TTL
+                # here would keep serving the row for up to ~48h
+                remaining = current_app.config['ANALYSIS_CACHE_TTL'] - int(
+                    (datetime.utcnow() - recent_analysis.analysis_date).total_seconds()
+                )
+                if remaining > 0:
+                    cache.set(cache_key, payload, timeout=remaining)
+                return jsonify({
+                    'message': 'Using cached analysis from last 24 hours',
+                    'analysis': payload
+                }), 200
+
         # Perform new analysis
         start_time = time.time()
         analyzer = PhoneAnalyzer(phone_number, deep_scan=deep_scan)
         analysis_result = analyzer.analyze()
         duration = time.time() - start_time
         
-        # Save to database
-        analysis = PhoneAnalysis(
-            phone_number=phone_number,
-            country_code=analysis_result.get('country_code'),
-            carrier=analysis_result.get('carrier'),
-            line_type=analysis_result.get('line_type'),
-            risk_score=analysis_result.get('risk_score'),
-            risk_level=analysis_result.get('risk_level'),
-            social_media_presence=analysis_result.get('social_media_presence'),
-            spam_reports_count=analysis_result.get('spam_reports_count'),
-            fraud_mentions_count=analysis_result.get('fraud_mentions_count'),
-            telegram_presence=analysis_result.get('telegram_presence'),
-            whatsapp_presence=analysis_result.get('whatsapp_presence'),
-            rich_metadata=analysis_result.get('rich_metadata'),  # Enhanced metadata
-            analysis_duration=duration,
-            data_sources_used=analysis_result.get('data_sources_used')
-        )
-        
-        db.session.add(analysis)
-        
-        # Add risk factors
-        from app.models.risk_factor import RiskFactor
-        for factor in analysis_result.get('risk_factors', []):
-            risk_factor = RiskFactor(
-                analysis=analysis,
-                category=factor.get('category'),
-                factor_type=factor.get('factor_type'),
-                severity=factor.get('severity'),
-                weight=factor.get('weight'),
-                score_contribution=factor.get('score_contribution'),
-                description=factor.get('description'),
-                evidence=factor.get('evidence'),
-                source=factor.get('source')
-            )
-            db.session.add(risk_factor)
-        
-        db.session.commit()
-        
+        # Save to database - deferred to the Celery worker when enabled so
+        # the client is not blocked on the INSERT + commit round-trips
+        from app.tasks import persist_analysis, save_analysis
+        if current_app.config.get('ASYNC_PERSISTENCE'):
+            persist_analysis.delay(analysis_result, duration)
+            return jsonify({
+                'message': 'Analysis completed successfully, persistence queued',
+                'analysis': dict(analysis_result, id=None)
+            }), 201
+
+        analysis = save_analysis(analysis_result, duration)
+
+        payload = analysis.to_dict()
+        cache.set(cache_key, payload,
+                  timeout=current_app.config['ANALYSIS_CACHE_TTL'])
+
         return jsonify({
             'message': 'Analysis completed successfully',
-            'analysis': analysis.to_dict()
+            'analysis': payload
         }), 201
         
     except Exception as e:
@@ -100,7 +99,7 @@ def analyze_phone():
 def get_report(analysis_id):
     """Get detailed analysis report by ID"""
     try:
-        analysis = PhoneAnalysis.query.get_or_404(analysis_id)
+        analysis = db.get_or_404(PhoneAnalysis, analysis_id)
         return jsonify(analysis.to_dict()), 200
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -109,17 +108,32 @@ def get_report(analysis_id):
 def get_history():
     """Get analysis history with pagination"""
     try:
-        page = request.args.get('page', 1, type=int)
-        per_page = request.args.get('per_page', 10, type=int)
-        
-        analyses = PhoneAnalysis.query.order_by(
-            PhoneAnalysis.analysis_date.desc()
-        ).paginate(page=page, per_page=per_page, error_out=False)
-        
+        # Clamp like paginate(error_out=False) did - page=0 would emit a
+        # negative OFFSET and per_page=0 a zero division in the page count
+        page = max(request.args.get('page', 1, type=int), 1)
+        per_page = max(request.args.get('per_page', 10, type=int), 1)
+
+        # Select only the columns the history table renders - skips ORM
+        # materialization and the per-row risk factor loads entirely
+        rows = db.session.execute(
+            select(
+                PhoneAnalysis.id,
+                PhoneAnalysis.phone_number,
+                PhoneAnalysis.carrier,
+                PhoneAnalysis.risk_score,
+                PhoneAnalysis.risk_level,
+                PhoneAnalysis.analysis_date
+            ).order_by(
+                PhoneAnalysis.analysis_date.desc()
+            ).limit(per_page).offset((page - 1) * per_page)
+        ).mappings().all()
+
+        total = db.session.scalar(select(func.count()).select_from(PhoneAnalysis))
+
         return jsonify({
-            'analyses': [analysis.to_dict() for analysis in analyses.items],
-            'total': analyses.total,
-            'pages': analyses.pages,
+            'analyses': [dict(row) for row in rows],
+            'total': total,
+            'pages': (total + per_page - 1) // per_page,
             'current_page': page
         }), 200
     except Exception as e:
@@ -132,21 +146,39 @@ def search_analyses():
         data = request.get_json()
         phone_number = data.get('phone_number')
         risk_level = data.get('risk_level')
-        
-        query = PhoneAnalysis.query
-        
+
+        stmt = select(
+            PhoneAnalysis.id,
+            PhoneAnalysis.phone_number,
+            PhoneAnalysis.carrier,
+            PhoneAnalysis.risk_score,
+            PhoneAnalysis.risk_level,
+            PhoneAnalysis.analysis_date
+        )
+
         if phone_number:
-            query = query.filter(PhoneAnalysis.phone_number.contains(phone_number))
-        
+            stmt = stmt.where(PhoneAnalysis.phone_number.contains(phone_number))
+
         if risk_level:
-            query = query.filter_by(risk_level=risk_level.upper())
-        
-        analyses = query.order_by(PhoneAnalysis.analysis_date.desc()).all()
-        
-        return jsonify({
-            'count': len(analyses),
-            'analyses': [analysis.to_dict() for analysis in analyses]
-        }), 200
+            stmt = stmt.where(PhoneAnalysis.risk_level == risk_level.upper())
+
+        stmt = stmt.order_by(PhoneAnalysis.analysis_date.desc())
+
+        # Stream the result set instead of buffering every row: memory stays
+        # O(batch) and the client sees the first rows immediately. Unbounded
+        # searches (e.g. every HIGH-risk number) no longer build giant lists.
+        def generate():
+            yield b'{"analyses":['
+            count = 0
+            result = db.session.execute(stmt.execution_options(yield_per=200))
+            for row in result.mappings():
+                chunk = orjson.dumps(dict(row))
+                yield chunk if count == 0 else b',' + chunk
+                count += 1
+            yield b'],"count":%d}' % count
+
+        return Response(stream_with_context(generate()),
+                        mimetype='application/json')
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -154,16 +186,13 @@ def search_analyses():
 def delete_analysis(analysis_id):
     """Delete a specific analysis by ID"""
     try:
-        analysis = PhoneAnalysis.query.get_or_404(analysis_id)
-        
-        # Delete associated risk factors first
-        from app.models.risk_factor import RiskFactor
-        RiskFactor.query.filter_by(analysis_id=analysis_id).delete()
-        
-        # Delete the analysis
+        analysis = db.get_or_404(PhoneAnalysis, analysis_id)
+
+        # Risk factors are removed by the delete-orphan cascade
         db.session.delete(analysis)
         db.session.commit()
-        
+        cache.delete(f"pa:{analysis.phone_number}")
+
         return jsonify({
             'message': 'Analysis deleted successfully',
             'id': analysis_id
@@ -176,14 +205,13 @@ def delete_analysis(analysis_id):
 def clear_all_history():
     """Delete all analysis history"""
     try:
-        # Delete all risk factors first
+        # Two bulk DELETE statements in one transaction - no per-row ORM work
         from app.models.risk_factor import RiskFactor
-        RiskFactor.query.delete()
-        
-        # Delete all analyses
-        count = PhoneAnalysis.query.delete()
+        db.session.execute(delete(RiskFactor))
+        count = db.session.execute(delete(PhoneAnalysis)).rowcount
         db.session.commit()
-        
+        cache.clear()
+
         return jsonify({
             'message': f'All analysis history cleared successfully',
             'deleted_count': count
@@ -196,11 +224,17 @@ def clear_all_history():
 def get_statistics():
     """Get overall statistics"""
     try:
-        total_analyses = PhoneAnalysis.query.count()
-        high_risk = PhoneAnalysis.query.filter_by(risk_level='HIGH').count()
-        medium_risk = PhoneAnalysis.query.filter_by(risk_level='MEDIUM').count()
-        low_risk = PhoneAnalysis.query.filter_by(risk_level='LOW').count()
-        
+        # Single grouped aggregate instead of four separate COUNT queries
+        level_counts = dict(db.session.execute(
+            select(PhoneAnalysis.risk_level, func.count())
+            .group_by(PhoneAnalysis.risk_level)
+        ).all())
+
+        total_analyses = sum(level_counts.values())
+        high_risk = level_counts.get('HIGH', 0)
+        medium_risk = level_counts.get('MEDIUM', 0)
+        low_risk = level_counts.get('LOW', 0)
+
         return jsonify({
             'total_analyses': total_analyses,
             'high_risk_count': high_risk,
@@ -4,16 +4,61 @@ Real OSINT Modules for Phone Number Analysis
 This module uses actual APIs for legitimate phone number verification and fraud detection.
 """
 
+import asyncio
+import httpx
+import logging
+import random
 import requests
 import os
 from typing import Dict, List
 from datetime import datetime
 
+from app.utils.validators import digits_only
+
+logger = logging.getLogger(__name__)
+
+
+# Async retry policy: statuses worth retrying and the backoff schedule.
+# Jitter desynchronizes concurrent retries against the same provider.
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_MAX_ATTEMPTS = 3  # initial call + 2 retries
+
+
+def _backoff(attempt):
+    return 0.2 * (2 ** attempt) * (0.5 + random.random() / 2)
+
 # Get API keys from environment variables
 NUMVERIFY_API_KEY = os.getenv('NUMVERIFY_API_KEY', '')
 IPQUALITYSCORE_API_KEY = os.getenv('IPQUALITYSCORE_API_KEY', '')
 ABSTRACT_API_KEY = os.getenv('ABSTRACT_API_KEY', '')
 
+# Precomputed responses for unconfigured/static paths. Treated as read-only
+# by callers - returning them avoids rebuilding the same dict per request.
+_NUMVERIFY_DISABLED = {
+    'error': 'NUMVERIFY_API_KEY not configured',
+    'valid': False
+}
+_IPQS_DISABLED = {
+    'error': 'IPQUALITYSCORE_API_KEY not configured',
+    'fraud_score': 0
+}
+_ABSTRACT_DISABLED = {
+    'error': 'ABSTRACT_API_KEY not configured',
+    'valid': False
+}
+_TELEGRAM_RESULT = {
+    'has_telegram_account': False,
+    'public_username': None,
+    'warning': 'Requires Telegram API credentials and user consent',
+    'setup_instructions': 'Install telethon: pip install telethon, Get API ID and Hash from https://my.telegram.org/apps'
+}
+_WHATSAPP_RESULT = {
+    'has_whatsapp': False,
+    'business_account': False,
+    'warning': 'Requires WhatsApp Business API access',
+    'setup_instructions': 'Apply for WhatsApp Business API at https://developers.facebook.com/docs/whatsapp'
+}
+
 
 class BaseScanner:
     """Base class for all OSINT scanners"""
@@ -38,12 +83,50 @@ class BaseScanner:
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
-            print(f"Request error: {e}")
+            logger.warning("Request to %s failed: %s", url, e)
             return None
         except Exception as e:
-            print(f"Error: {e}")
+            logger.warning("Unexpected error for %s: %s", url, e)
             return None
 
+    async def _make_request_async(self, client, url, method='GET', headers=None, data=None, params=None):
+        """
+        Async counterpart of _make_request, using a shared httpx client.
+
+        Transient failures (connection errors, 429 and 5xx responses) are
+        retried with exponential backoff and jitter.
+        """
+        default_headers = {'User-Agent': self.user_agent}
+        if headers:
+            default_headers.update(headers)
+
+        for attempt in range(_MAX_ATTEMPTS):
+            try:
+                if method == 'GET':
+                    response = await client.get(url, headers=default_headers, params=params)
+                else:
+                    response = await client.post(url, headers=default_headers, json=data)
+
+                if response.status_code in _RETRY_STATUSES and attempt < _MAX_ATTEMPTS - 1:
+                    await asyncio.sleep(_backoff(attempt))
+                    continue
+
+                response.raise_for_status()
+                return response.json()
+            except httpx.TransportError as e:
+                if attempt < _MAX_ATTEMPTS - 1:
+                    await asyncio.sleep(_backoff(attempt))
+                    continue
+                logger.warning("Request to %s failed: %s", url, e)
+                return None
+            except httpx.HTTPError as e:
+                logger.warning("Request to %s failed: %s", url, e)
+                return None
+            except Exception as e:
+                logger.warning("Unexpected error for %s: %s", url, e)
+                return None
+        return None
+
 
 class NumverifyValidator(BaseScanner):
     """
@@ -52,24 +135,31 @@ class NumverifyValidator(BaseScanner):
     Free tier: 100 requests/month
     """
     
-    def validate(self) -> Dict:
-        """Validate phone number and get carrier info"""
-        if not NUMVERIFY_API_KEY:
-            return {
-                'error': 'NUMVERIFY_API_KEY not configured',
-                'valid': False
-            }
-        
-        url = 'http://apilayer.net/api/validate'
-        params = {
+    URL = 'http://apilayer.net/api/validate'
+
+    def _params(self):
+        return {
             'access_key': NUMVERIFY_API_KEY,
             'number': self.phone_number,
             'country_code': '',
             'format': 1
         }
-        
-        data = self._make_request(url, params=params)
-        
+
+    def validate(self) -> Dict:
+        """Validate phone number and get carrier info"""
+        if not NUMVERIFY_API_KEY:
+            return _NUMVERIFY_DISABLED
+        data = self._make_request(self.URL, params=self._params())
+        return self._parse_response(data)
+
+    async def validate_async(self, client) -> Dict:
+        """Validate phone number using a shared async client"""
+        if not NUMVERIFY_API_KEY:
+            return _NUMVERIFY_DISABLED
+        data = await self._make_request_async(client, self.URL, params=self._params())
+        return self._parse_response(data)
+
+    def _parse_response(self, data) -> Dict:
         if data and data.get('valid'):
             return {
                 'valid': True,
@@ -95,25 +185,31 @@ class IPQualityScoreChecker(BaseScanner):
     Free tier: 5,000 requests/month
     """
     
+    PARAMS = {
+        'strictness': 1,  # 0-2, higher = more strict
+        'country[]': 'US'  # Can specify multiple countries
+    }
+
+    def _url(self):
+        # Strip to bare digits (cached single-pass regex)
+        clean_number = digits_only(self.phone_number)
+        return f'https://ipqualityscore.com/api/json/phone/{IPQUALITYSCORE_API_KEY}/{clean_number}'
+
     def check_fraud(self) -> Dict:
         """Check phone number for fraud indicators"""
         if not IPQUALITYSCORE_API_KEY:
-            return {
-                'error': 'IPQUALITYSCORE_API_KEY not configured',
-                'fraud_score': 0
-            }
-        
-        # Remove + and spaces from phone number
-        clean_number = self.phone_number.replace('+', '').replace(' ', '')
-        
-        url = f'https://ipqualityscore.com/api/json/phone/{IPQUALITYSCORE_API_KEY}/{clean_number}'
-        params = {
-            'strictness': 1,  # 0-2, higher = more strict
-            'country[]': 'US'  # Can specify multiple countries
-        }
-        
-        data = self._make_request(url, params=params)
-        
+            return _IPQS_DISABLED
+        data = self._make_request(self._url(), params=self.PARAMS)
+        return self._parse_response(data)
+
+    async def check_fraud_async(self, client) -> Dict:
+        """Check for fraud indicators using a shared async client"""
+        if not IPQUALITYSCORE_API_KEY:
+            return _IPQS_DISABLED
+        data = await self._make_request_async(client, self._url(), params=self.PARAMS)
+        return self._parse_response(data)
+
+    def _parse_response(self, data) -> Dict:
         if data and data.get('success'):
             return {
                 'fraud_score': data.get('fraud_score', 0),  # 0-100
@@ -144,22 +240,29 @@ class AbstractPhoneValidator(BaseScanner):
     Free tier: 250 requests/month
     """
     
-    def validate(self) -> Dict:
-        """Validate and get phone info"""
-        if not ABSTRACT_API_KEY:
-            return {
-                'error': 'ABSTRACT_API_KEY not configured',
-                'valid': False
-            }
-        
-        url = 'https://phonevalidation.abstractapi.com/v1/'
-        params = {
+    URL = 'https://phonevalidation.abstractapi.com/v1/'
+
+    def _params(self):
+        return {
             'api_key': ABSTRACT_API_KEY,
             'phone': self.phone_number
         }
-        
-        data = self._make_request(url, params=params)
-        
+
+    def validate(self) -> Dict:
+        """Validate and get phone info"""
+        if not ABSTRACT_API_KEY:
+            return _ABSTRACT_DISABLED
+        data = self._make_request(self.URL, params=self._params())
+        return self._parse_response(data)
+
+    async def validate_async(self, client) -> Dict:
+        """Validate phone info using a shared async client"""
+        if not ABSTRACT_API_KEY:
+            return _ABSTRACT_DISABLED
+        data = await self._make_request_async(client, self.URL, params=self._params())
+        return self._parse_response(data)
+
+    def _parse_response(self, data) -> Dict:
         if data and data.get('valid'):
             return {
                 'valid': True,
@@ -187,21 +290,36 @@ class SpamDatabaseChecker(BaseScanner):
     Check phone number against spam databases
     Uses free/public APIs and databases
     """
-    
+
+    def __init__(self, phone_number, ipqs_data=None):
+        super().__init__(phone_number)
+        # Pre-fetched IPQualityScore payload, avoids a duplicate API call
+        self.ipqs_data = ipqs_data
+
     def check(self) -> Dict:
         """Check against spam databases"""
+        fraud_data = self.ipqs_data
+        if fraud_data is None and IPQUALITYSCORE_API_KEY:
+            fraud_data = IPQualityScoreChecker(self.phone_number).check_fraud()
+        return self._build_results(fraud_data)
+
+    async def check_async(self, client) -> Dict:
+        """Check against spam databases, fetching missing data asynchronously"""
+        fraud_data = self.ipqs_data
+        if fraud_data is None and IPQUALITYSCORE_API_KEY:
+            fraud_data = await IPQualityScoreChecker(self.phone_number).check_fraud_async(client)
+        return self._build_results(fraud_data)
+
+    def _build_results(self, fraud_data) -> Dict:
         results = {
             'total_reports': 0,
             'details': [],
             'sources': [],
             'categories': []
         }
-        
+
         # Use IPQualityScore spam data if available
-        if IPQUALITYSCORE_API_KEY:
-            ipqs = IPQualityScoreChecker(self.phone_number)
-            fraud_data = ipqs.check_fraud()
-            
+        if fraud_data is not None:
             if not fraud_data.get('error'):
                 spam_score = fraud_data.get('spam_score', 0)
                 if spam_score > 0:
@@ -225,7 +343,8 @@ class SpamDatabaseChecker(BaseScanner):
         # - Twilio Lookup API
         # - Custom database queries
         
-        results['categories'] = list(set(results['categories']))
+        # Ordered dedup - keeps first-seen order for stable JSON output
+        results['categories'] = list(dict.fromkeys(results['categories']))
         return results
 
 
@@ -307,7 +426,7 @@ class PublicProfileChecker(BaseScanner):
         }
         
         # Clean phone number for search
-        clean_number = self.phone_number.replace('+', '').replace(' ', '').replace('-', '')
+        clean_number = digits_only(self.phone_number)
         
         # In production, you would:
         # 1. Use Google Custom Search API
@@ -329,23 +448,38 @@ class PublicProfileChecker(BaseScanner):
 
 class FraudForumScanner(BaseScanner):
     """Scan public fraud forums and databases"""
-    
+
+    def __init__(self, phone_number, ipqs_data=None):
+        super().__init__(phone_number)
+        # Pre-fetched IPQualityScore payload, avoids a duplicate API call
+        self.ipqs_data = ipqs_data
+
     def scan(self) -> Dict:
         """
         Search for phone number in public fraud reports
         """
+        fraud_data = self.ipqs_data
+        if fraud_data is None and IPQUALITYSCORE_API_KEY:
+            fraud_data = IPQualityScoreChecker(self.phone_number).check_fraud()
+        return self._build_results(fraud_data)
+
+    async def scan_async(self, client) -> Dict:
+        """Search fraud reports, fetching missing data asynchronously"""
+        fraud_data = self.ipqs_data
+        if fraud_data is None and IPQUALITYSCORE_API_KEY:
+            fraud_data = await IPQualityScoreChecker(self.phone_number).check_fraud_async(client)
+        return self._build_results(fraud_data)
+
+    def _build_results(self, fraud_data) -> Dict:
         results = {
             'mentions_count': 0,
             'mentions': [],
             'risk_level': 'LOW',
             'sources_checked': []
         }
-        
+
         # Use IPQualityScore data if available
-        if IPQUALITYSCORE_API_KEY:
-            ipqs = IPQualityScoreChecker(self.phone_number)
-            fraud_data = ipqs.check_fraud()
-            
+        if fraud_data is not None:
             if not fraud_data.get('error'):
                 if fraud_data.get('recent_abuse') or fraud_data.get('risky'):
                     results['mentions_count'] = 1
@@ -372,12 +506,7 @@ class TelegramScanner(BaseScanner):
     """
     
     def scan(self) -> Dict:
-        return {
-            'has_telegram_account': False,
-            'public_username': None,
-            'warning': 'Requires Telegram API credentials and user consent',
-            'setup_instructions': 'Install telethon: pip install telethon, Get API ID and Hash from https://my.telegram.org/apps'
-        }
+        return _TELEGRAM_RESULT
 
 
 class WhatsAppChecker(BaseScanner):
@@ -387,9 +516,4 @@ class WhatsAppChecker(BaseScanner):
     """
     
     def check(self) -> Dict:
-        return {
-            'has_whatsapp': False,
-            'business_account': False,
-            'warning': 'Requires WhatsApp Business API access',
-            'setup_instructions': 'Apply for WhatsApp Business API at https://developers.facebook.com/docs/whatsapp'
-        }
+        return _WHATSAPP_RESULT
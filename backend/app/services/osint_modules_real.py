@@ -4,46 +4,174 @@ Real OSINT Modules for Phone Number Analysis
 This module uses actual APIs for legitimate phone number verification and fraud detection.
 """
 
+import asyncio
+import httpx
+import logging
+import random
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
 from typing import Dict, List
 from datetime import datetime
 
+from app.utils.validators import digits_only
+
+logger = logging.getLogger(__name__)
+
+
+# Async retry policy: statuses worth retrying and the backoff schedule.
+# Jitter desynchronizes concurrent retries against the same provider.
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_MAX_ATTEMPTS = 3  # initial call + 2 retries
+
+
+def _backoff(attempt):
+    return 0.2 * (2 ** attempt) * (0.5 + random.random() / 2)
+
 # Get API keys from environment variables
 NUMVERIFY_API_KEY = os.getenv('NUMVERIFY_API_KEY', '')
 IPQUALITYSCORE_API_KEY = os.getenv('IPQUALITYSCORE_API_KEY', '')
 ABSTRACT_API_KEY = os.getenv('ABSTRACT_API_KEY', '')
 
+# Precomputed responses for unconfigured/static paths. Treated as read-only
+# by callers - returning them avoids rebuilding the same dict per request.
+_NUMVERIFY_DISABLED = {
+    'error': 'NUMVERIFY_API_KEY not configured',
+    'valid': False
+}
+_IPQS_DISABLED = {
+    'error': 'IPQUALITYSCORE_API_KEY not configured',
+    'fraud_score': 0
+}
+_ABSTRACT_DISABLED = {
+    'error': 'ABSTRACT_API_KEY not configured',
+    'valid': False
+}
+_TELEGRAM_RESULT = {
+    'has_telegram_account': False,
+    'public_username': None,
+    'warning': 'Requires Telegram API credentials and user consent',
+    'setup_instructions': 'Install telethon: pip install telethon, Get API ID and Hash from https://my.telegram.org/apps'
+}
+_WHATSAPP_RESULT = {
+    'has_whatsapp': False,
+    'business_account': False,
+    'warning': 'Requires WhatsApp Business API access',
+    'setup_instructions': 'Apply for WhatsApp Business API at https://developers.facebook.com/docs/whatsapp'
+}
+
+
+def _build_session():
+    """
+    Build a pooled session so TCP/TLS connections are reused across calls
+
+    When requests-cache is installed, upstream responses are cached for an
+    hour (keyed on URL + params) so repeat lookups of the same number spend
+    no API quota. Redis is used when REDIS_URL is set, in-memory otherwise.
+    """
+    try:
+        import requests_cache
+        redis_url = os.getenv('REDIS_URL')
+        if redis_url:
+            import redis
+            backend = requests_cache.RedisCache(connection=redis.Redis.from_url(redis_url))
+        else:
+            backend = 'memory'
+        session = requests_cache.CachedSession(backend=backend, expire_after=3600)
+    except ImportError:
+        session = requests.Session()
+
+    # Retry transient upstream failures at the transport layer: two retries
+    # with a short backoff cover rate-limit blips and provider 5xx hiccups
+    # without the scanners growing their own retry loops.
+    retry = Retry(
+        total=2,
+        backoff_factor=0.2,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=['GET', 'POST']
+    )
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retry)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+# One process-wide session: connections, the response cache and the retry
+# policy are shared by every scanner instance
+_SESSION = _build_session()
+
 
 class BaseScanner:
     """Base class for all OSINT scanners"""
-    
+
+    session = _SESSION
+
     def __init__(self, phone_number):
         self.phone_number = phone_number
         self.results = {}
         self.user_agent = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        
+
     def _make_request(self, url, method='GET', headers=None, data=None, params=None):
         """Make HTTP request with error handling"""
         try:
             default_headers = {'User-Agent': self.user_agent}
             if headers:
                 default_headers.update(headers)
-                
+
             if method == 'GET':
-                response = requests.get(url, headers=default_headers, params=params, timeout=15)
+                response = self.session.get(url, headers=default_headers, params=params, timeout=15)
             else:
-                response = requests.post(url, headers=default_headers, json=data, timeout=15)
-                
+                response = self.session.post(url, headers=default_headers, json=data, timeout=15)
+
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
-            print(f"Request error: {e}")
+            logger.warning("Request to %s failed: %s", url, e)
             return None
         except Exception as e:
-            print(f"Error: {e}")
+            logger.warning("Unexpected error for %s: %s", url, e)
             return None
 
+    async def _make_request_async(self, client, url, method='GET', headers=None, data=None, params=None):
+        """
+        Async counterpart of _make_request, using a shared httpx client.
+
+        Transient failures (connection errors, 429 and 5xx responses) are
+        retried with exponential backoff and jitter, mirroring the retry
+        policy the sync session gets from its urllib3 adapter.
+        """
+        default_headers = {'User-Agent': self.user_agent}
+        if headers:
+            default_headers.update(headers)
+
+        for attempt in range(_MAX_ATTEMPTS):
+            try:
+                if method == 'GET':
+                    response = await client.get(url, headers=default_headers, params=params)
+                else:
+                    response = await client.post(url, headers=default_headers, json=data)
+
+                if response.status_code in _RETRY_STATUSES and attempt < _MAX_ATTEMPTS - 1:
+                    await asyncio.sleep(_backoff(attempt))
+                    continue
+
+                response.raise_for_status()
+                return response.json()
+            except httpx.TransportError as e:
+                if attempt < _MAX_ATTEMPTS - 1:
+                    await asyncio.sleep(_backoff(attempt))
+                    continue
+                logger.warning("Request to %s failed: %s", url, e)
+                return None
+            except httpx.HTTPError as e:
+                logger.warning("Request to %s failed: %s", url, e)
+                return None
+            except Exception as e:
+                logger.warning("Unexpected error for %s: %s", url, e)
+                return None
+        return None
+
 
 class NumverifyValidator(BaseScanner):
     """
@@ -52,24 +180,33 @@ class NumverifyValidator(BaseScanner):
     Free tier: 100 requests/month
     """
     
-    def validate(self) -> Dict:
-        """Validate phone number and get carrier info"""
-        if not NUMVERIFY_API_KEY:
-            return {
-                'error': 'NUMVERIFY_API_KEY not configured',
-                'valid': False
-            }
-        
-        url = 'http://apilayer.net/api/validate'
-        params = {
+    URL = 'http://apilayer.net/api/validate'
+
+    def _params(self) -> Dict:
+        return {
             'access_key': NUMVERIFY_API_KEY,
             'number': self.phone_number,
             'country_code': '',
             'format': 1
         }
-        
-        data = self._make_request(url, params=params)
-        
+
+    def validate(self) -> Dict:
+        """Validate phone number and get carrier info"""
+        if not NUMVERIFY_API_KEY:
+            return _NUMVERIFY_DISABLED
+
+        data = self._make_request(self.URL, params=self._params())
+        return self._parse_response(data)
+
+    async def validate_async(self, client) -> Dict:
+        """Async variant of validate() sharing the same response parsing"""
+        if not NUMVERIFY_API_KEY:
+            return _NUMVERIFY_DISABLED
+
+        data = await self._make_request_async(client, self.URL, params=self._params())
+        return self._parse_response(data)
+
+    def _parse_response(self, data) -> Dict:
         if data and data.get('valid'):
             return {
                 'valid': True,
@@ -95,25 +232,33 @@ class IPQualityScoreChecker(BaseScanner):
     Free tier: 5,000 requests/month
     """
     
+    PARAMS = {
+        'strictness': 1,  # 0-2, higher = more strict
+        'country[]': 'US'  # Can specify multiple countries
+    }
+
+    def _url(self) -> str:
+        # Strip to bare digits (cached single-pass regex)
+        clean_number = digits_only(self.phone_number)
+        return f'https://ipqualityscore.com/api/json/phone/{IPQUALITYSCORE_API_KEY}/{clean_number}'
+
     def check_fraud(self) -> Dict:
         """Check phone number for fraud indicators"""
         if not IPQUALITYSCORE_API_KEY:
-            return {
-                'error': 'IPQUALITYSCORE_API_KEY not configured',
-                'fraud_score': 0
-            }
-        
-        # Remove + and spaces from phone number
-        clean_number = self.phone_number.replace('+', '').replace(' ', '')
-        
-        url = f'https://ipqualityscore.com/api/json/phone/{IPQUALITYSCORE_API_KEY}/{clean_number}'
-        params = {
-            'strictness': 1,  # 0-2, higher = more strict
-            'country[]': 'US'  # Can specify multiple countries
-        }
-        
-        data = self._make_request(url, params=params)
-        
+            return _IPQS_DISABLED
+
+        data = self._make_request(self._url(), params=self.PARAMS)
+        return self._parse_response(data)
+
+    async def check_fraud_async(self, client) -> Dict:
+        """Async variant of check_fraud() sharing the same response parsing"""
+        if not IPQUALITYSCORE_API_KEY:
+            return _IPQS_DISABLED
+
+        data = await self._make_request_async(client, self._url(), params=self.PARAMS)
+        return self._parse_response(data)
+
+    def _parse_response(self, data) -> Dict:
         if data and data.get('success'):
             return {
                 'fraud_score': data.get('fraud_score', 0),  # 0-100
@@ -144,22 +289,31 @@ class AbstractPhoneValidator(BaseScanner):
     Free tier: 250 requests/month
     """
     
-    def validate(self) -> Dict:
-        """Validate and get phone info"""
-        if not ABSTRACT_API_KEY:
-            return {
-                'error': 'ABSTRACT_API_KEY not configured',
-                'valid': False
-            }
-        
-        url = 'https://phonevalidation.abstractapi.com/v1/'
-        params = {
+    URL = 'https://phonevalidation.abstractapi.com/v1/'
+
+    def _params(self) -> Dict:
+        return {
             'api_key': ABSTRACT_API_KEY,
             'phone': self.phone_number
         }
-        
-        data = self._make_request(url, params=params)
-        
+
+    def validate(self) -> Dict:
+        """Validate and get phone info"""
+        if not ABSTRACT_API_KEY:
+            return _ABSTRACT_DISABLED
+
+        data = self._make_request(self.URL, params=self._params())
+        return self._parse_response(data)
+
+    async def validate_async(self, client) -> Dict:
+        """Async variant of validate() sharing the same response parsing"""
+        if not ABSTRACT_API_KEY:
+            return _ABSTRACT_DISABLED
+
+        data = await self._make_request_async(client, self.URL, params=self._params())
+        return self._parse_response(data)
+
+    def _parse_response(self, data) -> Dict:
         if data and data.get('valid'):
             return {
                 'valid': True,
@@ -187,7 +341,12 @@ class SpamDatabaseChecker(BaseScanner):
     Check phone number against spam databases
     Uses free/public APIs and databases
     """
-    
+
+    def __init__(self, phone_number, ipqs_data=None):
+        super().__init__(phone_number)
+        # Pre-fetched IPQualityScore payload, avoids a duplicate API call
+        self.ipqs_data = ipqs_data
+
     def check(self) -> Dict:
         """Check against spam databases"""
         results = {
@@ -196,12 +355,13 @@ class SpamDatabaseChecker(BaseScanner):
             'sources': [],
             'categories': []
         }
-        
+
         # Use IPQualityScore spam data if available
         if IPQUALITYSCORE_API_KEY:
-            ipqs = IPQualityScoreChecker(self.phone_number)
-            fraud_data = ipqs.check_fraud()
-            
+            fraud_data = self.ipqs_data
+            if fraud_data is None:
+                fraud_data = IPQualityScoreChecker(self.phone_number).check_fraud()
+
             if not fraud_data.get('error'):
                 spam_score = fraud_data.get('spam_score', 0)
                 if spam_score > 0:
@@ -225,7 +385,8 @@ class SpamDatabaseChecker(BaseScanner):
         # - Twilio Lookup API
         # - Custom database queries
         
-        results['categories'] = list(set(results['categories']))
+        # Ordered dedup - keeps first-seen order for stable JSON output
+        results['categories'] = list(dict.fromkeys(results['categories']))
         return results
 
 
@@ -265,7 +426,12 @@ class SocialMediaScanner(BaseScanner):
 
 class FraudForumScanner(BaseScanner):
     """Scan public fraud forums and databases"""
-    
+
+    def __init__(self, phone_number, ipqs_data=None):
+        super().__init__(phone_number)
+        # Pre-fetched IPQualityScore payload, avoids a duplicate API call
+        self.ipqs_data = ipqs_data
+
     def scan(self) -> Dict:
         """
         Search for phone number in public fraud reports
@@ -276,12 +442,13 @@ class FraudForumScanner(BaseScanner):
             'risk_level': 'LOW',
             'sources_checked': []
         }
-        
+
         # Use IPQualityScore data if available
         if IPQUALITYSCORE_API_KEY:
-            ipqs = IPQualityScoreChecker(self.phone_number)
-            fraud_data = ipqs.check_fraud()
-            
+            fraud_data = self.ipqs_data
+            if fraud_data is None:
+                fraud_data = IPQualityScoreChecker(self.phone_number).check_fraud()
+
             if not fraud_data.get('error'):
                 if fraud_data.get('recent_abuse') or fraud_data.get('risky'):
                     results['mentions_count'] = 1
@@ -308,12 +475,7 @@ class TelegramScanner(BaseScanner):
     """
     
     def scan(self) -> Dict:
-        return {
-            'has_telegram_account': False,
-            'public_username': None,
-            'warning': 'Requires Telegram API credentials and user consent',
-            'setup_instructions': 'Install telethon: pip install telethon, Get API ID and Hash from https://my.telegram.org/apps'
-        }
+        return _TELEGRAM_RESULT
 
 
 class WhatsAppChecker(BaseScanner):
@@ -323,9 +485,30 @@ class WhatsAppChecker(BaseScanner):
     """
     
     def check(self) -> Dict:
-        return {
-            'has_whatsapp': False,
-            'business_account': False,
-            'warning': 'Requires WhatsApp Business API access',
-            'setup_instructions': 'Apply for WhatsApp Business API at https://developers.facebook.com/docs/whatsapp'
-        }
+        return _WHATSAPP_RESULT
+
+
+def run_provider_checks(phone_number) -> Dict:
+    """
+    Fan out the Numverify, IPQualityScore and Abstract lookups concurrently.
+
+    Uses one shared httpx.AsyncClient so connections are pooled, and
+    asyncio.gather so total wall time is the slowest provider rather than
+    the sum of all three.
+    """
+    async def _gather():
+        limits = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+        timeout = httpx.Timeout(15.0, connect=5.0)
+        async with httpx.AsyncClient(limits=limits, timeout=timeout) as client:
+            return await asyncio.gather(
+                NumverifyValidator(phone_number).validate_async(client),
+                IPQualityScoreChecker(phone_number).check_fraud_async(client),
+                AbstractPhoneValidator(phone_number).validate_async(client)
+            )
+
+    numverify_data, ipqs_data, abstract_data = asyncio.run(_gather())
+    return {
+        'numverify': numverify_data,
+        'ipqualityscore': ipqs_data,
+        'abstract': abstract_data
+    }
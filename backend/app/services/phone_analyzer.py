@@ -1,6 +1,12 @@
+import asyncio
+import httpx
 import phonenumbers
 from phonenumbers import carrier, geocoder, timezone
+import inspect
 import time
+from dataclasses import asdict, dataclass
+from functools import lru_cache, wraps
+from typing import Dict, List, NamedTuple, Optional, Tuple
 from app.services.osint_modules import (
     NumverifyValidator,
     IPQualityScoreChecker,
@@ -13,12 +19,154 @@ from app.services.osint_modules import (
 )
 from app.services.risk_scorer import RiskScorer
 
+
+# All the local phonenumbers metadata for a number, resolved in one cached
+# lookup. The prefix-table walks are pure functions of the number string,
+# and one cache entry per number beats four separate caches that each pay
+# their own key hash and bookkeeping.
+
+class _NumberProfile(NamedTuple):
+    parsed: phonenumbers.PhoneNumber
+    e164: str
+    carrier: str
+    location: str
+    timezones: Tuple[str, ...]
+
+
+@lru_cache(maxsize=1024)
+def _number_profile(number):
+    parsed = phonenumbers.parse(number, None)
+    return _NumberProfile(
+        parsed=parsed,
+        e164=phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164),
+        carrier=carrier.name_for_number(parsed, "en") or "Unknown",
+        location=geocoder.description_for_number(parsed, "en") or "Unknown",
+        timezones=timezone.time_zones_for_number(parsed),
+    )
+
+
+# Rich metadata sections as slotted dataclasses: fixed attribute slots
+# instead of per-section hash tables while the metadata is assembled and
+# the risk rules run; asdict() converts them for the JSON payload once.
+
+@dataclass(slots=True)
+class CarrierDetails:
+    current_carrier: str
+    original_carrier: str
+    line_type: str
+    is_voip: bool
+    is_prepaid: Optional[bool]
+    porting_detected: bool = False
+    porting_history: Optional[List[Dict]] = None
+
+
+@dataclass(slots=True)
+class GeographicData:
+    country: str
+    country_name: str
+    city: str
+    region: str
+    location_formatted: str
+    timezone: str
+    all_timezones: Tuple[str, ...]
+
+
+@dataclass(slots=True)
+class NumberStatus:
+    active: bool
+    valid: bool
+    risky: bool
+    do_not_call: bool
+
+
+@dataclass(slots=True)
+class ReputationIndicators:
+    fraud_score: int
+    spam_score: int
+    recent_abuse: bool
+    leak_detected: bool = False  # Would be from data breach checks
+
+
+# Declarative metadata risk rules: (predicate, factor builder), both taking
+# the CarrierDetails and NumberStatus instances. Adding an indicator is one
+# tuple here instead of another if-block in _get_rich_metadata.
+_RISK_RULES = (
+    (
+        lambda cd, ns: cd.is_voip,
+        lambda cd, ns: {
+            'category': 'carrier',
+            'factor_type': 'voip_number',
+            'severity': 'MEDIUM',
+            'weight': 0.15,
+            'description': 'VOIP numbers are commonly used in fraud schemes',
+            'evidence': {'is_voip': True},
+            'source': 'Carrier Analysis'
+        },
+    ),
+    (
+        lambda cd, ns: cd.porting_detected,
+        lambda cd, ns: {
+            'category': 'carrier',
+            'factor_type': 'porting_detected',
+            'severity': 'LOW',
+            'weight': 0.10,
+            'description': 'Number has been ported between carriers',
+            'evidence': cd.porting_history or [],
+            'source': 'Carrier Analysis'
+        },
+    ),
+    (
+        lambda cd, ns: ns.do_not_call,
+        lambda cd, ns: {
+            'category': 'compliance',
+            'factor_type': 'do_not_call_registry',
+            'severity': 'LOW',
+            'weight': 0.05,
+            'description': 'Number is on Do Not Call registry',
+            'evidence': {'do_not_call': True},
+            'source': 'Compliance Check'
+        },
+    ),
+)
+
+
+def _step(err_key):
+    """
+    Mark a method as one analysis step: a failure is recorded under
+    err_key in self.results instead of aborting the whole analysis.
+    Replaces the identical try/except wrapper each step used to carry;
+    async steps are wrapped with an async shim so awaiting still works.
+    """
+    def decorator(method):
+        if inspect.iscoroutinefunction(method):
+            @wraps(method)
+            async def wrapper(self, *args, **kwargs):
+                try:
+                    return await method(self, *args, **kwargs)
+                except Exception as e:
+                    self.results[err_key] = str(e)
+        else:
+            @wraps(method)
+            def wrapper(self, *args, **kwargs):
+                try:
+                    return method(self, *args, **kwargs)
+                except Exception as e:
+                    self.results[err_key] = str(e)
+        return wrapper
+    return decorator
+
+
 class PhoneAnalyzer:
     """Main phone number analysis orchestrator"""
     
     def __init__(self, phone_number, deep_scan=False):
         self.phone_number = phone_number
         self.deep_scan = deep_scan
+        # Parsed number and normalized E.164 form, set by _get_basic_info so
+        # every scanner reuses one canonical string instead of re-normalizing
+        self.parsed = None
+        self.e164 = phone_number
+        self._ipqs_data = None
         self.results = {
             'phone_number': phone_number,
             'data_sources_used': [],
@@ -28,277 +176,310 @@ class PhoneAnalyzer:
     def analyze(self):
         """Perform complete analysis"""
         try:
-            # Step 1: Basic phone validation and info
+            # Step 1: Basic phone validation and info (local, fast)
             self._get_basic_info()
-            
-            # Step 2: Enhanced metadata from APIs
-            self._get_rich_metadata()
-            
-            # Step 3: Social media presence check
-            self._check_social_media()
-            
-            # Step 4: Spam database check
-            self._check_spam_databases()
-            
-            # Step 5: Fraud forum scan
-            self._check_fraud_forums()
-            
-            # Step 6: Messaging app presence
-            self._check_messaging_apps()
-            
+
+            # Steps 2-6: OSINT lookups, run concurrently - total wall time is
+            # the slowest provider rather than the sum of all of them. An
+            # unparseable number can't be looked up anywhere, so skip the
+            # network fan-out entirely and score what we have.
+            if self.parsed is not None:
+                asyncio.run(self._analyze_async())
+
             # Step 7: Calculate risk score
             self._calculate_risk()
-            
+
             return self.results
-            
+
         except Exception as e:
             raise Exception(f"Analysis failed: {str(e)}")
+
+    async def _analyze_async(self, client=None):
+        """
+        Run the OSINT checks concurrently on one shared httpx client.
+
+        Rich metadata runs first because the spam and fraud checks reuse
+        its IPQualityScore response; the remaining checks fan out after
+        it. The local-only checks (social media, messaging apps) run
+        inline - they do no network I/O.
+
+        A caller that analyzes many numbers can pass its own client so
+        connections are shared across analyses.
+        """
+        if client is None:
+            async with httpx.AsyncClient(timeout=15) as client:
+                return await self._analyze_async(client)
+
+        await self._get_rich_metadata(client)
+        await asyncio.gather(
+            self._check_spam_databases(client),
+            self._check_fraud_forums(client),
+        )
+        self._check_social_media()
+        self._check_messaging_apps()
     
+    @_step('basic_info_error')
     def _get_basic_info(self):
         """Extract basic phone number information"""
-        try:
-            parsed = phonenumbers.parse(self.phone_number, None)
-            
-            self.results['country_code'] = f"+{parsed.country_code}"
-            self.results['carrier'] = carrier.name_for_number(parsed, "en") or "Unknown"
-            self.results['line_type'] = phonenumbers.number_type(parsed)
-            self.results['location'] = geocoder.description_for_number(parsed, "en") or "Unknown"
-            self.results['timezones'] = timezone.time_zones_for_number(parsed)
-            
-            self.results['data_sources_used'].append('phonenumbers_library')
-            
-        except Exception as e:
-            self.results['basic_info_error'] = str(e)
+        profile = _number_profile(self.phone_number)
+        self.parsed = profile.parsed
+        self.e164 = profile.e164
+
+        self.results['country_code'] = f"+{profile.parsed.country_code}"
+        self.results['carrier'] = profile.carrier
+        self.results['line_type'] = phonenumbers.number_type(profile.parsed)
+        self.results['location'] = profile.location
+        self.results['timezones'] = profile.timezones
+        
+        self.results['data_sources_used'].append('phonenumbers_library')
+        
     
-    def _get_rich_metadata(self):
+    @_step('rich_metadata_error')
+    async def _get_rich_metadata(self, client):
         """Get enhanced metadata from IPQualityScore and Numverify"""
-        try:
-            # Get IPQualityScore data
-            ipqs_checker = IPQualityScoreChecker(self.phone_number)
-            ipqs_data = ipqs_checker.check_fraud()
-            
-            # Get Numverify data
-            numverify = NumverifyValidator(self.phone_number)
-            numverify_data = numverify.validate()
-            
-            # Determine prepaid status with better logic
-            # IPQualityScore free tier has limited prepaid detection, especially for non-US numbers
-            is_prepaid = ipqs_data.get('prepaid', None)
-            line_type_value = ipqs_data.get('line_type', '').lower()
-            
-            # If prepaid status is unknown and line type suggests mobile, assume prepaid for certain countries
-            if is_prepaid is None or (is_prepaid is False and ipqs_data.get('country') in ['IN', 'PH', 'ID', 'BD']):
-                # In India and similar markets, most mobile numbers are prepaid
-                if 'mobile' in line_type_value or 'wireless' in line_type_value:
-                    is_prepaid = None  # Unknown, but likely prepaid in these markets
-            
-            # Compile rich metadata
-            rich_metadata = {
-                'carrier_details': {
-                    'current_carrier': ipqs_data.get('carrier') or numverify_data.get('carrier', 'Unknown'),
-                    'original_carrier': numverify_data.get('carrier', 'Unknown'),
-                    'porting_detected': False,  # Will be true if carriers don't match
-                    'line_type': ipqs_data.get('line_type') or numverify_data.get('line_type', 'Unknown'),
-                    'is_voip': ipqs_data.get('VOIP', False),
-                    'is_prepaid': is_prepaid,
-                },
-                'geographic_data': {
-                    'country': ipqs_data.get('country', ''),
-                    'country_name': numverify_data.get('country_name', ''),
-                    'city': ipqs_data.get('city') if ipqs_data.get('city') != 'N/A' else numverify_data.get('location', 'Unknown'),
-                    'region': ipqs_data.get('region', 'Unknown'),
-                    'location_formatted': numverify_data.get('location', ''),
-                    'timezone': self.results.get('timezones', [])[0] if self.results.get('timezones') else 'Unknown',
-                    'all_timezones': self.results.get('timezones', []),
-                },
-                'number_status': {
-                    'active': ipqs_data.get('active', True),  # Default to True if unknown
-                    'valid': numverify_data.get('valid', False),
-                    'risky': ipqs_data.get('risky', False),
-                    'do_not_call': ipqs_data.get('do_not_call', False),
-                },
-                'reputation_indicators': {
-                    'fraud_score': ipqs_data.get('fraud_score', 0),
-                    'spam_score': ipqs_data.get('spam_score', 0),
-                    'recent_abuse': ipqs_data.get('recent_abuse', False),
-                    'leak_detected': False,  # Would be from data breach checks
-                }
-            }
-            
-            # Detect porting (if carriers don't match)
-            if (rich_metadata['carrier_details']['current_carrier'] != 'Unknown' and 
-                rich_metadata['carrier_details']['original_carrier'] != 'Unknown' and
-                rich_metadata['carrier_details']['current_carrier'] != rich_metadata['carrier_details']['original_carrier']):
-                rich_metadata['carrier_details']['porting_detected'] = True
-                rich_metadata['carrier_details']['porting_history'] = [
-                    {'carrier': rich_metadata['carrier_details']['original_carrier'], 'status': 'Original'},
-                    {'carrier': rich_metadata['carrier_details']['current_carrier'], 'status': 'Current'}
-                ]
-            
-            # Estimate number age based on carrier type and activity
-            if ipqs_data.get('active'):
-                if ipqs_data.get('VOIP'):
-                    rich_metadata['estimated_age'] = 'Recent (VOIP numbers are typically newer)'
-                elif ipqs_data.get('prepaid'):
-                    rich_metadata['estimated_age'] = 'Variable (Prepaid numbers can be recycled)'
-                else:
-                    rich_metadata['estimated_age'] = 'Established (Active traditional line)'
+        # Both provider calls run concurrently; the IPQualityScore data
+        # is kept on the instance so the spam and fraud checks reuse it
+        # instead of re-calling the API
+        ipqs_data, numverify_data = await asyncio.gather(
+            IPQualityScoreChecker(self.e164).check_fraud_async(client),
+            NumverifyValidator(self.e164).validate_async(client),
+        )
+        self._ipqs_data = ipqs_data
+
+        # Bind the hot attribute lookups once - this block hits the two
+        # provider dicts a few dozen times
+        ipqs_get = ipqs_data.get
+        nv_get = numverify_data.get
+        timezones = self.results.get('timezones', [])
+
+        # Determine prepaid status with better logic
+        # IPQualityScore free tier has limited prepaid detection, especially for non-US numbers
+        is_prepaid = ipqs_get('prepaid', None)
+        line_type_value = ipqs_get('line_type', '').lower()
+
+        # If prepaid status is unknown and line type suggests mobile, assume prepaid for certain countries
+        if is_prepaid is None or (is_prepaid is False and ipqs_get('country') in ['IN', 'PH', 'ID', 'BD']):
+            # In India and similar markets, most mobile numbers are prepaid
+            if 'mobile' in line_type_value or 'wireless' in line_type_value:
+                is_prepaid = None  # Unknown, but likely prepaid in these markets
+
+        # Compile rich metadata into the slotted section objects
+        cd = CarrierDetails(
+            current_carrier=ipqs_get('carrier') or nv_get('carrier', 'Unknown'),
+            original_carrier=nv_get('carrier', 'Unknown'),
+            line_type=ipqs_get('line_type') or nv_get('line_type', 'Unknown'),
+            is_voip=ipqs_get('VOIP', False),
+            is_prepaid=is_prepaid,
+        )
+        geographic_data = GeographicData(
+            country=ipqs_get('country', ''),
+            country_name=nv_get('country_name', ''),
+            city=ipqs_get('city') if ipqs_get('city') != 'N/A' else nv_get('location', 'Unknown'),
+            region=ipqs_get('region', 'Unknown'),
+            location_formatted=nv_get('location', ''),
+            timezone=timezones[0] if timezones else 'Unknown',
+            all_timezones=timezones,
+        )
+        number_status = NumberStatus(
+            active=ipqs_get('active', True),  # Default to True if unknown
+            valid=nv_get('valid', False),
+            risky=ipqs_get('risky', False),
+            do_not_call=ipqs_get('do_not_call', False),
+        )
+        reputation_indicators = ReputationIndicators(
+            fraud_score=ipqs_get('fraud_score', 0),
+            spam_score=ipqs_get('spam_score', 0),
+            recent_abuse=ipqs_get('recent_abuse', False),
+        )
+
+        # Detect porting (if carriers don't match)
+        if (cd.current_carrier != 'Unknown' and
+            cd.original_carrier != 'Unknown' and
+            cd.current_carrier != cd.original_carrier):
+            cd.porting_detected = True
+            cd.porting_history = [
+                {'carrier': cd.original_carrier, 'status': 'Original'},
+                {'carrier': cd.current_carrier, 'status': 'Current'}
+            ]
+
+        # One asdict() pass converts the sections for the JSON payload;
+        # a porting_history that was never set stays out of it, as before
+        cd_dict = asdict(cd)
+        if cd_dict['porting_history'] is None:
+            del cd_dict['porting_history']
+
+        rich_metadata = {
+            'carrier_details': cd_dict,
+            'geographic_data': asdict(geographic_data),
+            'number_status': asdict(number_status),
+            'reputation_indicators': asdict(reputation_indicators),
+        }
+
+        # Estimate number age based on carrier type and activity
+        if ipqs_get('active'):
+            if ipqs_get('VOIP'):
+                rich_metadata['estimated_age'] = 'Recent (VOIP numbers are typically newer)'
+            elif ipqs_get('prepaid'):
+                rich_metadata['estimated_age'] = 'Variable (Prepaid numbers can be recycled)'
             else:
-                rich_metadata['estimated_age'] = 'Unknown or Inactive'
-            
-            self.results['rich_metadata'] = rich_metadata
-            self.results['data_sources_used'].extend(['IPQualityScore', 'Numverify'])
-            
-            # Add risk factors based on metadata
-            if rich_metadata['carrier_details']['is_voip']:
-                self.results['risk_factors'].append({
-                    'category': 'carrier',
-                    'factor_type': 'voip_number',
-                    'severity': 'MEDIUM',
-                    'weight': 0.15,
-                    'description': 'VOIP numbers are commonly used in fraud schemes',
-                    'evidence': {'is_voip': True},
-                    'source': 'Carrier Analysis'
-                })
-            
-            if rich_metadata['carrier_details']['porting_detected']:
-                self.results['risk_factors'].append({
-                    'category': 'carrier',
-                    'factor_type': 'porting_detected',
-                    'severity': 'LOW',
-                    'weight': 0.10,
-                    'description': 'Number has been ported between carriers',
-                    'evidence': rich_metadata['carrier_details'].get('porting_history', []),
-                    'source': 'Carrier Analysis'
-                })
-            
-            if rich_metadata['number_status']['do_not_call']:
-                self.results['risk_factors'].append({
-                    'category': 'compliance',
-                    'factor_type': 'do_not_call_registry',
-                    'severity': 'LOW',
-                    'weight': 0.05,
-                    'description': 'Number is on Do Not Call registry',
-                    'evidence': {'do_not_call': True},
-                    'source': 'Compliance Check'
-                })
-                
-        except Exception as e:
-            self.results['rich_metadata_error'] = str(e)
+                rich_metadata['estimated_age'] = 'Established (Active traditional line)'
+        else:
+            rich_metadata['estimated_age'] = 'Unknown or Inactive'
+        
+        self.results['rich_metadata'] = rich_metadata
+        self.results['data_sources_used'].extend(['IPQualityScore', 'Numverify'])
+        
+        # Add risk factors based on metadata
+        for predicate, build_factor in _RISK_RULES:
+            if predicate(cd, number_status):
+                self.results['risk_factors'].append(build_factor(cd, number_status))
+
     
+    @_step('social_media_error')
     def _check_social_media(self):
         """Check social media presence"""
-        try:
-            scanner = SocialMediaScanner(self.phone_number)
-            social_results = scanner.scan()
-            
-            self.results['social_media_presence'] = social_results
-            self.results['data_sources_used'].extend(['social_media_scan'])
+        scanner = SocialMediaScanner(self.e164)
+        social_results = scanner.scan()
+        
+        self.results['social_media_presence'] = social_results
+        self.results['data_sources_used'].extend(['social_media_scan'])
+        
+        # Add risk factors if anomalies found
+        if social_results.get('anomaly_detected'):
+            self.results['risk_factors'].append({
+                'category': 'social_media',
+                'factor_type': 'suspicious_activity',
+                'severity': social_results.get('severity', 'MEDIUM'),
+                'weight': 0.30,
+                'description': social_results.get('anomaly_description'),
+                'evidence': social_results,
+                'source': 'Social Media Scan'
+            })
             
-            # Add risk factors if anomalies found
-            if social_results.get('anomaly_detected'):
-                self.results['risk_factors'].append({
-                    'category': 'social_media',
-                    'factor_type': 'suspicious_activity',
-                    'severity': social_results.get('severity', 'MEDIUM'),
-                    'weight': 0.30,
-                    'description': social_results.get('anomaly_description'),
-                    'evidence': social_results,
-                    'source': 'Social Media Scan'
-                })
-                
-        except Exception as e:
-            self.results['social_media_error'] = str(e)
     
-    def _check_spam_databases(self):
+    @_step('spam_check_error')
+    async def _check_spam_databases(self, client):
         """Check spam/scam databases"""
-        try:
-            checker = SpamDatabaseChecker(self.phone_number)
-            spam_results = checker.check()
-            
-            self.results['spam_reports_count'] = spam_results.get('total_reports', 0)
-            self.results['spam_details'] = spam_results.get('details', [])
-            self.results['data_sources_used'].extend(spam_results.get('sources', []))
+        checker = SpamDatabaseChecker(self.e164, ipqs_data=self._ipqs_data)
+        spam_results = await checker.check_async(client)
+        
+        self.results['spam_reports_count'] = spam_results.get('total_reports', 0)
+        self.results['spam_details'] = spam_results.get('details', [])
+        self.results['data_sources_used'].extend(spam_results.get('sources', []))
+        
+        # Add risk factors based on spam reports
+        if spam_results.get('total_reports', 0) > 0:
+            severity = 'HIGH' if spam_results['total_reports'] > 10 else 'MEDIUM'
+            self.results['risk_factors'].append({
+                'category': 'spam_reports',
+                'factor_type': 'reported_spam',
+                'severity': severity,
+                'weight': 0.25,
+                'description': f"Number reported {spam_results['total_reports']} times in spam databases",
+                'evidence': spam_results,
+                'source': 'Spam Databases'
+            })
             
-            # Add risk factors based on spam reports
-            if spam_results.get('total_reports', 0) > 0:
-                severity = 'HIGH' if spam_results['total_reports'] > 10 else 'MEDIUM'
-                self.results['risk_factors'].append({
-                    'category': 'spam_reports',
-                    'factor_type': 'reported_spam',
-                    'severity': severity,
-                    'weight': 0.25,
-                    'description': f"Number reported {spam_results['total_reports']} times in spam databases",
-                    'evidence': spam_results,
-                    'source': 'Spam Databases'
-                })
-                
-        except Exception as e:
-            self.results['spam_check_error'] = str(e)
     
-    def _check_fraud_forums(self):
+    @_step('fraud_scan_error')
+    async def _check_fraud_forums(self, client):
         """Check fraud forums and dark web mentions"""
-        try:
-            scanner = FraudForumScanner(self.phone_number)
-            fraud_results = scanner.scan()
-            
-            self.results['fraud_mentions_count'] = fraud_results.get('mentions_count', 0)
-            self.results['fraud_details'] = fraud_results.get('mentions', [])
-            self.results['data_sources_used'].extend(['fraud_forum_scan'])
+        scanner = FraudForumScanner(self.e164, ipqs_data=self._ipqs_data)
+        fraud_results = await scanner.scan_async(client)
+        
+        self.results['fraud_mentions_count'] = fraud_results.get('mentions_count', 0)
+        self.results['fraud_details'] = fraud_results.get('mentions', [])
+        self.results['data_sources_used'].extend(['fraud_forum_scan'])
+        
+        # Add risk factors if found in fraud forums
+        if fraud_results.get('mentions_count', 0) > 0:
+            self.results['risk_factors'].append({
+                'category': 'fraud_forum',
+                'factor_type': 'fraud_mention',
+                'severity': 'HIGH',
+                'weight': 0.25,
+                'description': f"Number mentioned in {fraud_results['mentions_count']} fraud-related discussions",
+                'evidence': fraud_results,
+                'source': 'Fraud Forums'
+            })
             
-            # Add risk factors if found in fraud forums
-            if fraud_results.get('mentions_count', 0) > 0:
-                self.results['risk_factors'].append({
-                    'category': 'fraud_forum',
-                    'factor_type': 'fraud_mention',
-                    'severity': 'HIGH',
-                    'weight': 0.25,
-                    'description': f"Number mentioned in {fraud_results['mentions_count']} fraud-related discussions",
-                    'evidence': fraud_results,
-                    'source': 'Fraud Forums'
-                })
-                
-        except Exception as e:
-            self.results['fraud_scan_error'] = str(e)
     
+    @_step('messaging_apps_error')
     def _check_messaging_apps(self):
         """Check Telegram and WhatsApp presence"""
-        try:
-            # Telegram scan
-            telegram_scanner = TelegramScanner(self.phone_number)
-            telegram_results = telegram_scanner.scan()
-            self.results['telegram_presence'] = telegram_results
-            
-            # WhatsApp check
-            whatsapp_checker = WhatsAppChecker(self.phone_number)
-            whatsapp_results = whatsapp_checker.check()
-            self.results['whatsapp_presence'] = whatsapp_results
-            
-            self.results['data_sources_used'].extend(['telegram_scan', 'whatsapp_check'])
+        # Telegram scan
+        telegram_scanner = TelegramScanner(self.e164)
+        telegram_results = telegram_scanner.scan()
+        self.results['telegram_presence'] = telegram_results
+        
+        # WhatsApp check
+        whatsapp_checker = WhatsAppChecker(self.e164)
+        whatsapp_results = whatsapp_checker.check()
+        self.results['whatsapp_presence'] = whatsapp_results
+        
+        self.results['data_sources_used'].extend(['telegram_scan', 'whatsapp_check'])
+        
+        # Add risk factors for suspicious messaging app activity
+        if telegram_results.get('suspicious_groups'):
+            self.results['risk_factors'].append({
+                'category': 'messaging_apps',
+                'factor_type': 'suspicious_telegram_activity',
+                'severity': 'MEDIUM',
+                'weight': 0.10,
+                'description': f"Found in {len(telegram_results['suspicious_groups'])} suspicious Telegram groups",
+                'evidence': telegram_results,
+                'source': 'Telegram'
+            })
             
-            # Add risk factors for suspicious messaging app activity
-            if telegram_results.get('suspicious_groups'):
-                self.results['risk_factors'].append({
-                    'category': 'messaging_apps',
-                    'factor_type': 'suspicious_telegram_activity',
-                    'severity': 'MEDIUM',
-                    'weight': 0.10,
-                    'description': f"Found in {len(telegram_results['suspicious_groups'])} suspicious Telegram groups",
-                    'evidence': telegram_results,
-                    'source': 'Telegram'
-                })
-                
-        except Exception as e:
-            self.results['messaging_apps_error'] = str(e)
     
     def _calculate_risk(self):
         """Calculate overall risk score"""
         scorer = RiskScorer(self.results)
         risk_score, risk_level = scorer.calculate()
-        
+
         self.results['risk_score'] = risk_score
         self.results['risk_level'] = risk_level
-        
-        # Add score contribution to each risk factor
-        for factor in self.results['risk_factors']:
-            factor['score_contribution'] = scorer.get_factor_contribution(factor)
+
+        # Attach score contributions, computed for all factors in one
+        # pass; the contributions come back unrounded, so round here at
+        # the point they enter the persisted payload
+        factors = self.results['risk_factors']
+        for factor, contribution in zip(factors, scorer.get_factor_contributions(factors)):
+            factor['score_contribution'] = round(contribution, 2)
+
+
+class BulkPhoneAnalyzer:
+    """Analyze many phone numbers concurrently on one shared HTTP client"""
+
+    def __init__(self, deep_scan=False):
+        self.deep_scan = deep_scan
+
+    async def analyze_many(self, phone_numbers, concurrency=32):
+        """
+        Analyze an iterable of phone numbers concurrently.
+
+        Duplicate inputs are analyzed once, connections are pooled on a
+        single client, and a semaphore caps in-flight analyses so
+        provider rate limits are not overrun.
+
+        Returns:
+            dict: phone number -> analysis results
+        """
+        numbers = list(dict.fromkeys(phone_numbers))
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async with httpx.AsyncClient(timeout=15) as client:
+            async def analyze_one(number):
+                async with semaphore:
+                    analyzer = PhoneAnalyzer(number, deep_scan=self.deep_scan)
+                    analyzer._get_basic_info()
+                    # Same guard as analyze(): an unparseable number gets
+                    # no provider fan-out, just the basic-info error
+                    if analyzer.parsed is not None:
+                        await analyzer._analyze_async(client)
+                    analyzer._calculate_risk()
+                    return analyzer.results
+
+            results = await asyncio.gather(*(analyze_one(n) for n in numbers))
+
+        return dict(zip(numbers, results))
@@ -4,22 +4,83 @@ Report Generator Module
 Generates detailed PDF and JSON reports for phone number analyses.
 """
 
-from datetime import datetime
+import asyncio
+from datetime import datetime, timezone
 from typing import Dict
-import json
+import orjson
 import os
 from flask import current_app
 
+from app.utils.validators import digits_only
+
+# Section separators, built once instead of per report
+_HEADER_BAR = "=" * 80
+_SECTION_BAR = "-" * 80
+
+# Static lookup tables shared by every report
+_THREAT_CATEGORIES = {
+    'CRITICAL': 'Confirmed Fraud',
+    'HIGH': 'Likely Fraud',
+    'MEDIUM': 'Suspicious Activity',
+    'LOW': 'Minor Concerns',
+    'MINIMAL': 'Clean'
+}
+
+_HIGH_RISK_RECOMMENDATIONS = (
+    "Do not engage with this phone number",
+    "Block the number immediately",
+    "Report to local authorities if contacted",
+    "Alert your organization's security team"
+)
+
+_MEDIUM_RISK_RECOMMENDATIONS = (
+    "Exercise caution when engaging with this number",
+    "Verify identity through alternative channels",
+    "Do not share sensitive information",
+    "Monitor for suspicious activity"
+)
+
+_LOW_RISK_RECOMMENDATIONS = (
+    "Standard verification procedures recommended",
+    "Follow normal security protocols",
+    "Continue monitoring if concerns arise"
+)
+
 class ReportGenerator:
     """Generate analysis reports in various formats"""
     
-    def __init__(self, analysis_data: Dict):
+    def __init__(self, analysis_data: Dict, include_raw: bool = False):
         self.analysis = analysis_data
+        # raw_data duplicates the whole analysis inside the JSON report;
+        # opt in explicitly when the full payload is needed
+        self.include_raw = include_raw
+        # Structured sections, built lazily and shared by every report
+        # generated from this instance
+        self._cached_sections = None
         self.report_dir = current_app.config.get('REPORTS_DIR', 'reports')
         
         # Create reports directory if it doesn't exist
         os.makedirs(self.report_dir, exist_ok=True)
-    
+
+    def _sections(self) -> Dict:
+        """
+        Build the structured report sections once per instance.
+
+        Generating a JSON and a text report for the same analysis reuses
+        the cached sections instead of recomputing summary, findings and
+        recommendations for each format.
+        """
+        if self._cached_sections is None:
+            self._cached_sections = {
+                'executive_summary': self._generate_executive_summary(),
+                'phone_information': self._extract_phone_info(),
+                'risk_assessment': self._extract_risk_assessment(),
+                'osint_findings': self._extract_osint_findings(),
+                'detailed_risk_factors': self._extract_risk_factors(),
+                'recommendations': self._generate_recommendations()
+            }
+        return self._cached_sections
+
     def generate_json_report(self) -> str:
         """
         Generate JSON report
@@ -27,31 +88,31 @@ class ReportGenerator:
         Returns:
             str: Path to generated report file
         """
+        # One clock read per report; utcnow() is deprecated in 3.12
+        now = datetime.now(timezone.utc)
+
         report_data = {
             'report_metadata': {
-                'generated_at': datetime.utcnow().isoformat(),
+                'generated_at': now.isoformat(),
                 'report_version': '1.0',
                 'analysis_id': self.analysis.get('id')
             },
-            'executive_summary': self._generate_executive_summary(),
-            'phone_information': self._extract_phone_info(),
-            'risk_assessment': self._extract_risk_assessment(),
-            'osint_findings': self._extract_osint_findings(),
-            'detailed_risk_factors': self._extract_risk_factors(),
-            'recommendations': self._generate_recommendations(),
-            'raw_data': self.analysis
+            **self._sections()
         }
-        
+        if self.include_raw:
+            report_data['raw_data'] = self.analysis
+
         # Generate filename
-        phone = self.analysis.get('phone_number', 'unknown').replace('+', '')
-        timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
+        phone = digits_only(self.analysis.get('phone_number', '')) or 'unknown'
+        timestamp = now.strftime('%Y%m%d_%H%M%S')
         filename = f"report_{phone}_{timestamp}.json"
         filepath = os.path.join(self.report_dir, filename)
         
-        # Save report
-        with open(filepath, 'w') as f:
-            json.dump(report_data, f, indent=2)
-        
+        # Save report - orjson serializes in one shot to bytes, so the
+        # file is opened in binary mode
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(report_data, option=orjson.OPT_INDENT_2))
+
         return filepath
     
     def generate_text_report(self) -> str:
@@ -61,94 +122,87 @@ class ReportGenerator:
         Returns:
             str: Path to generated report file
         """
-        report_lines = []
-        
-        # Header
-        report_lines.append("=" * 80)
-        report_lines.append("OSINT FRAUD DETECTION ANALYSIS REPORT")
-        report_lines.append("=" * 80)
-        report_lines.append(f"Generated: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}")
-        report_lines.append(f"Report ID: {self.analysis.get('id')}")
-        report_lines.append("")
-        
-        # Executive Summary
-        report_lines.append("-" * 80)
-        report_lines.append("EXECUTIVE SUMMARY")
-        report_lines.append("-" * 80)
-        summary = self._generate_executive_summary()
-        report_lines.append(summary['summary_text'])
-        report_lines.append("")
-        
-        # Phone Information
-        report_lines.append("-" * 80)
-        report_lines.append("PHONE NUMBER INFORMATION")
-        report_lines.append("-" * 80)
-        phone_info = self._extract_phone_info()
-        for key, value in phone_info.items():
-            report_lines.append(f"{key.replace('_', ' ').title()}: {value}")
-        report_lines.append("")
-        
-        # Risk Assessment
-        report_lines.append("-" * 80)
-        report_lines.append("RISK ASSESSMENT")
-        report_lines.append("-" * 80)
-        risk = self._extract_risk_assessment()
-        report_lines.append(f"Risk Score: {risk['risk_score']}/100")
-        report_lines.append(f"Risk Level: {risk['risk_level']}")
-        report_lines.append(f"Threat Category: {risk.get('threat_category', 'Unknown')}")
-        report_lines.append("")
-        
-        # Risk Factors
-        report_lines.append("-" * 80)
-        report_lines.append("DETAILED RISK FACTORS")
-        report_lines.append("-" * 80)
-        risk_factors = self._extract_risk_factors()
-        for i, factor in enumerate(risk_factors, 1):
-            report_lines.append(f"\n{i}. {factor['factor_type'].upper()}")
-            report_lines.append(f"   Category: {factor['category']}")
-            report_lines.append(f"   Severity: {factor['severity']}")
-            report_lines.append(f"   Description: {factor['description']}")
-            report_lines.append(f"   Score Contribution: {factor['score_contribution']}")
-        report_lines.append("")
-        
-        # OSINT Findings
-        report_lines.append("-" * 80)
-        report_lines.append("OSINT FINDINGS")
-        report_lines.append("-" * 80)
-        findings = self._extract_osint_findings()
-        for key, value in findings.items():
-            if isinstance(value, dict):
-                report_lines.append(f"\n{key.replace('_', ' ').title()}:")
-                for sub_key, sub_value in value.items():
-                    report_lines.append(f"  - {sub_key}: {sub_value}")
-            else:
-                report_lines.append(f"{key.replace('_', ' ').title()}: {value}")
-        report_lines.append("")
-        
-        # Recommendations
-        report_lines.append("-" * 80)
-        report_lines.append("RECOMMENDATIONS")
-        report_lines.append("-" * 80)
-        recommendations = self._generate_recommendations()
-        for i, rec in enumerate(recommendations, 1):
-            report_lines.append(f"{i}. {rec}")
-        report_lines.append("")
-        
-        # Footer
-        report_lines.append("=" * 80)
-        report_lines.append("END OF REPORT")
-        report_lines.append("=" * 80)
-        
-        # Generate filename and save
-        phone = self.analysis.get('phone_number', 'unknown').replace('+', '')
-        timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
+        # Generate filename; one clock read covers the name and header
+        now = datetime.now(timezone.utc)
+        phone = digits_only(self.analysis.get('phone_number', '')) or 'unknown'
+        timestamp = now.strftime('%Y%m%d_%H%M%S')
         filename = f"report_{phone}_{timestamp}.txt"
         filepath = os.path.join(self.report_dir, filename)
-        
+
+        # Write straight to the buffered file handle - no intermediate
+        # line list, no 80-column separators rebuilt per report
         with open(filepath, 'w') as f:
-            f.write('\n'.join(report_lines))
-        
+            w = f.write
+
+            # Header
+            w(f"{_HEADER_BAR}\n")
+            w("OSINT FRAUD DETECTION ANALYSIS REPORT\n")
+            w(f"{_HEADER_BAR}\n")
+            w(f"Generated: {now.strftime('%Y-%m-%d %H:%M:%S UTC')}\n")
+            w(f"Report ID: {self.analysis.get('id')}\n\n")
+
+            # Executive Summary
+            w(f"{_SECTION_BAR}\nEXECUTIVE SUMMARY\n{_SECTION_BAR}\n")
+            sections = self._sections()
+            summary = sections['executive_summary']
+            w(f"{summary['summary_text']}\n\n")
+
+            # Phone Information
+            w(f"{_SECTION_BAR}\nPHONE NUMBER INFORMATION\n{_SECTION_BAR}\n")
+            phone_info = sections['phone_information']
+            for key, value in phone_info.items():
+                w(f"{key.replace('_', ' ').title()}: {value}\n")
+            w("\n")
+
+            # Risk Assessment
+            w(f"{_SECTION_BAR}\nRISK ASSESSMENT\n{_SECTION_BAR}\n")
+            risk = sections['risk_assessment']
+            w(f"Risk Score: {risk['risk_score']}/100\n")
+            w(f"Risk Level: {risk['risk_level']}\n")
+            w(f"Threat Category: {risk.get('threat_category', 'Unknown')}\n\n")
+
+            # Risk Factors
+            w(f"{_SECTION_BAR}\nDETAILED RISK FACTORS\n{_SECTION_BAR}\n")
+            risk_factors = sections['detailed_risk_factors']
+            for i, factor in enumerate(risk_factors, 1):
+                w(f"\n{i}. {factor['factor_type'].upper()}\n")
+                w(f"   Category: {factor['category']}\n")
+                w(f"   Severity: {factor['severity']}\n")
+                w(f"   Description: {factor['description']}\n")
+                w(f"   Score Contribution: {factor['score_contribution']}\n")
+            w("\n")
+
+            # OSINT Findings
+            w(f"{_SECTION_BAR}\nOSINT FINDINGS\n{_SECTION_BAR}\n")
+            findings = sections['osint_findings']
+            for key, value in findings.items():
+                if isinstance(value, dict):
+                    w(f"\n{key.replace('_', ' ').title()}:\n")
+                    for sub_key, sub_value in value.items():
+                        w(f"  - {sub_key}: {sub_value}\n")
+                else:
+                    w(f"{key.replace('_', ' ').title()}: {value}\n")
+            w("\n")
+
+            # Recommendations
+            w(f"{_SECTION_BAR}\nRECOMMENDATIONS\n{_SECTION_BAR}\n")
+            recommendations = sections['recommendations']
+            for i, rec in enumerate(recommendations, 1):
+                w(f"{i}. {rec}\n")
+            w("\n")
+
+            # Footer
+            w(f"{_HEADER_BAR}\nEND OF REPORT\n{_HEADER_BAR}\n")
+
         return filepath
+
+    async def generate_json_report_async(self) -> str:
+        """Generate a JSON report without blocking the event loop"""
+        return await asyncio.to_thread(self.generate_json_report)
+
+    async def generate_text_report_async(self) -> str:
+        """Generate a text report without blocking the event loop"""
+        return await asyncio.to_thread(self.generate_text_report)
     
     def _generate_executive_summary(self) -> Dict:
         """Generate executive summary"""
@@ -156,26 +210,30 @@ class ReportGenerator:
         risk_level = self.analysis.get('risk_level', 'UNKNOWN')
         phone = self.analysis.get('phone_number')
         
-        summary_text = f"Analysis of phone number {phone} reveals a {risk_level} risk level "
-        summary_text += f"with an overall risk score of {risk_score}/100. "
-        
         spam_count = self.analysis.get('spam_reports_count', 0)
         fraud_count = self.analysis.get('fraud_mentions_count', 0)
-        
+
+        # Collect the sentences and join once - repeated += rebuilds the
+        # growing string on every concatenation
+        parts = [
+            f"Analysis of phone number {phone} reveals a {risk_level} risk level ",
+            f"with an overall risk score of {risk_score}/100. "
+        ]
+
         if spam_count > 0:
-            summary_text += f"The number has {spam_count} spam report(s). "
+            parts.append(f"The number has {spam_count} spam report(s). ")
         if fraud_count > 0:
-            summary_text += f"Found {fraud_count} mention(s) in fraud forums. "
-        
+            parts.append(f"Found {fraud_count} mention(s) in fraud forums. ")
+
         if risk_level in ['HIGH', 'CRITICAL']:
-            summary_text += "Immediate investigation recommended."
+            parts.append("Immediate investigation recommended.")
         elif risk_level == 'MEDIUM':
-            summary_text += "Caution advised when engaging with this number."
+            parts.append("Caution advised when engaging with this number.")
         else:
-            summary_text += "No significant fraud indicators detected."
-        
+            parts.append("No significant fraud indicators detected.")
+
         return {
-            'summary_text': summary_text,
+            'summary_text': ''.join(parts),
             'risk_score': risk_score,
             'risk_level': risk_level,
             'key_findings': {
@@ -199,19 +257,11 @@ class ReportGenerator:
     def _extract_risk_assessment(self) -> Dict:
         """Extract risk assessment details"""
         risk_level = self.analysis.get('risk_level', 'UNKNOWN')
-        
-        threat_categories = {
-            'CRITICAL': 'Confirmed Fraud',
-            'HIGH': 'Likely Fraud',
-            'MEDIUM': 'Suspicious Activity',
-            'LOW': 'Minor Concerns',
-            'MINIMAL': 'Clean'
-        }
-        
+
         return {
             'risk_score': self.analysis.get('risk_score', 0),
             'risk_level': risk_level,
-            'threat_category': threat_categories.get(risk_level, 'Unknown')
+            'threat_category': _THREAT_CATEGORIES.get(risk_level, 'Unknown')
         }
     
     def _extract_osint_findings(self) -> Dict:
@@ -232,23 +282,14 @@ class ReportGenerator:
     def _generate_recommendations(self) -> list:
         """Generate recommendations based on risk level"""
         risk_level = self.analysis.get('risk_level', 'UNKNOWN')
-        recommendations = []
-        
+
         if risk_level in ['HIGH', 'CRITICAL']:
-            recommendations.append("Do not engage with this phone number")
-            recommendations.append("Block the number immediately")
-            recommendations.append("Report to local authorities if contacted")
-            recommendations.append("Alert your organization's security team")
+            recommendations = list(_HIGH_RISK_RECOMMENDATIONS)
         elif risk_level == 'MEDIUM':
-            recommendations.append("Exercise caution when engaging with this number")
-            recommendations.append("Verify identity through alternative channels")
-            recommendations.append("Do not share sensitive information")
-            recommendations.append("Monitor for suspicious activity")
+            recommendations = list(_MEDIUM_RISK_RECOMMENDATIONS)
         else:
-            recommendations.append("Standard verification procedures recommended")
-            recommendations.append("Follow normal security protocols")
-            recommendations.append("Continue monitoring if concerns arise")
-        
+            recommendations = list(_LOW_RISK_RECOMMENDATIONS)
+
         # Add specific recommendations based on findings
         if self.analysis.get('spam_reports_count', 0) > 10:
             recommendations.append("Number has extensive spam history - treat with extreme caution")
@@ -0,0 +1,57 @@
+"""
+Numeric kernels for batch risk scoring.
+
+The compute-bound pieces of RiskScorer.score_batch - the threshold-band
+lookups and the weighted total with its 0-100 clamp - live here so they
+can be JIT-compiled with numba when it is installed. numba is an
+optional dependency: without it the kernels fall back to the equivalent
+vectorized NumPy expressions, which score_batch used inline before.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+
+if _HAS_NUMBA:
+
+    @njit(cache=True)
+    def _band_lookup_jit(counts, thresholds, scores):
+        out = np.empty(counts.shape[0], dtype=np.float64)
+        for i in range(counts.shape[0]):
+            out[i] = scores[np.searchsorted(thresholds, counts[i])]
+        return out
+
+    @njit(cache=True, parallel=True)
+    def _weighted_totals_jit(scores, weights):
+        n, k = scores.shape
+        out = np.empty(n, dtype=np.float64)
+        for i in prange(n):
+            total = 0.0
+            for j in range(k):
+                total += scores[i, j] * weights[j]
+            if total < 0.0:
+                total = 0.0
+            elif total > 100.0:
+                total = 100.0
+            out[i] = total
+        return out
+
+
+def band_scores(counts: np.ndarray, thresholds: np.ndarray,
+                scores: np.ndarray) -> np.ndarray:
+    """Map each count onto its step-function score band"""
+    if _HAS_NUMBA:
+        return _band_lookup_jit(counts, thresholds, scores)
+    return scores[np.searchsorted(thresholds, counts)]
+
+
+def weighted_totals(scores: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """Weighted sum of category scores per row, clamped to 0-100"""
+    if _HAS_NUMBA:
+        return _weighted_totals_jit(scores, weights)
+    return np.clip(scores @ weights, 0.0, 100.0)
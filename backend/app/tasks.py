@@ -0,0 +1,95 @@
+"""
+Background Tasks
+
+Moves analysis persistence off the /analyze request path. The Celery
+worker (Redis broker) is optional: when ASYNC_PERSISTENCE is disabled
+the route calls save_analysis synchronously, exactly as before.
+
+Run a worker via the entrypoint that binds Celery to the Flask app
+(celery_worker.py builds the app and calls init_celery):
+    celery -A celery_worker.celery worker --loglevel=info
+"""
+
+from celery import Celery
+
+celery = Celery('osint_fraud')
+
+
+def init_celery(app):
+    """Bind Celery to the Flask app config and run tasks in app context"""
+    celery.conf.update(
+        broker_url=app.config.get('CELERY_BROKER_URL'),
+        result_backend=app.config.get('CELERY_RESULT_BACKEND'),
+    )
+
+    class ContextTask(celery.Task):
+        def __call__(self, *args, **kwargs):
+            with app.app_context():
+                return self.run(*args, **kwargs)
+
+    celery.Task = ContextTask
+    return celery
+
+
+def save_analysis(analysis_result, duration):
+    """
+    Persist an analysis and its risk factors (single flush + bulk insert)
+
+    Returns:
+        PhoneAnalysis: the committed analysis row
+    """
+    from app import db
+    from app.models.phone_analysis import PhoneAnalysis
+    from app.models.risk_factor import RiskFactor
+
+    analysis = PhoneAnalysis(
+        phone_number=analysis_result.get('phone_number'),
+        country_code=analysis_result.get('country_code'),
+        carrier=analysis_result.get('carrier'),
+        line_type=analysis_result.get('line_type'),
+        risk_score=analysis_result.get('risk_score'),
+        risk_level=analysis_result.get('risk_level'),
+        social_media_presence=analysis_result.get('social_media_presence'),
+        spam_reports_count=analysis_result.get('spam_reports_count'),
+        fraud_mentions_count=analysis_result.get('fraud_mentions_count'),
+        telegram_presence=analysis_result.get('telegram_presence'),
+        whatsapp_presence=analysis_result.get('whatsapp_presence'),
+        rich_metadata=analysis_result.get('rich_metadata'),
+        analysis_duration=duration,
+        data_sources_used=analysis_result.get('data_sources_used')
+    )
+
+    db.session.add(analysis)
+    db.session.flush()  # assign analysis.id for the bulk mappings
+
+    risk_factors = analysis_result.get('risk_factors', [])
+    if risk_factors:
+        db.session.bulk_insert_mappings(RiskFactor, [
+            {
+                'analysis_id': analysis.id,
+                'category': factor.get('category'),
+                'factor_type': factor.get('factor_type'),
+                'severity': factor.get('severity'),
+                'weight': factor.get('weight'),
+                'score_contribution': factor.get('score_contribution'),
+                'description': factor.get('description'),
+                'evidence': factor.get('evidence'),
+                'source': factor.get('source')
+            }
+            for factor in risk_factors
+        ])
+
+    db.session.commit()
+    return analysis
+
+
+@celery.task(name='app.tasks.persist_analysis')
+def persist_analysis(analysis_result, duration):
+    """Persist an analysis outside the request path and warm the cache"""
+    from flask import current_app
+    from app import cache
+
+    analysis = save_analysis(analysis_result, duration)
+    cache.set(f"pa:{analysis.phone_number}", analysis.to_dict(),
+              timeout=current_app.config['ANALYSIS_CACHE_TTL'])
+    return analysis.id
@@ -1,24 +1,88 @@
-import phonenumbers
-from phonenumbers import NumberParseException
+import re
+from functools import lru_cache
 
-def validate_phone_number(phone_number):
+# phonenumbers is imported lazily inside the cached helpers below: its
+# metadata tables are expensive to load, and workers that never validate
+# a number shouldn't pay for them at boot. sys.modules makes the inline
+# import a dict lookup on every call after the first.
+
+# Compiled once; strips formatting (+, spaces, dashes, dots) in a single pass
+_NONDIGIT = re.compile(r'[^\d]')
+
+# Canonical E.164: '+', a non-zero country-code digit, 8-15 digits total.
+# Used as a cheap pre-check so the common case never reaches the much
+# more expensive phonenumbers.parse
+_E164_RE = re.compile(r'^\+[1-9]\d{7,14}$')
+
+# '+' followed only by digits and common separators - no vanity letters
+# to normalize and no extension markers (x, ext, #, ;) for libphonenumber
+# to strip, so the digit count alone decides the E.164 shape
+_PLAIN_INTL_RE = re.compile(r'^\+[\d\s().-]*$')
+
+
+@lru_cache(maxsize=4096)
+def digits_only(phone_number):
+    """Return just the digits of a phone number (cached per input string)"""
+    return _NONDIGIT.sub('', phone_number)
+
+
+@lru_cache(maxsize=4096)
+def _parse(phone_number, region=None):
+    """Shared parse cache - validate followed by format parses once"""
+    import phonenumbers
+    return phonenumbers.parse(phone_number, region)
+
+
+def validate_phone_number(phone_number, region=None):
     """
     Validate phone number format
-    
+
+    Args:
+        phone_number: The number to validate
+        region: Optional ISO region hint (e.g. 'IN') for numbers without
+                a '+' prefix; ignored for international format
+
     Returns:
         tuple: (is_valid, error_message)
     """
     if not phone_number:
         return False, "Phone number is required"
-    
+
+    # Non-string JSON payloads (numbers, lists) must fail as a 400, not
+    # escape as an AttributeError from .strip()
+    if not isinstance(phone_number, str):
+        return False, "Phone number must be a string"
+
+    phone_number = phone_number.strip()
+
+    if phone_number.startswith('+'):
+        # Fast reject, but only for plain digits-and-separators input:
+        # vanity letters ('+1-800-FLOWERS') and extensions ('... ext 99')
+        # change the digit count during parsing, so they must still go
+        # through phonenumbers. The region hint is irrelevant in
+        # international format.
+        if (_PLAIN_INTL_RE.match(phone_number)
+                and not _E164_RE.match('+' + digits_only(phone_number))):
+            return False, "Invalid phone number format"
+        region = None
+
+    # Strip before caching so '  +1... ' and '+1...' share an entry
+    return _validate_cached(phone_number, region)
+
+
+@lru_cache(maxsize=4096)
+def _validate_cached(phone_number, region=None):
+    import phonenumbers
+    from phonenumbers import NumberParseException
+
     try:
-        parsed = phonenumbers.parse(phone_number, None)
-        
+        parsed = _parse(phone_number, region)
+
         if not phonenumbers.is_valid_number(parsed):
             return False, "Invalid phone number format"
-        
+
         return True, None
-        
+
     except NumberParseException as e:
         return False, f"Invalid phone number: {str(e)}"
     except Exception as e:
@@ -26,8 +90,26 @@ def validate_phone_number(phone_number):
 
 def format_phone_number(phone_number):
     """Format phone number to E.164 standard"""
+    if not phone_number or not isinstance(phone_number, str):
+        return phone_number
+
+    phone_number = phone_number.strip()
+
+    # Fast path: already canonical E.164, nothing to reformat
+    if _E164_RE.match(phone_number):
+        return phone_number
+
+    return _format_cached(phone_number)
+
+
+@lru_cache(maxsize=4096)
+def _format_cached(phone_number):
+    import phonenumbers
+    from phonenumbers import NumberParseException
+
     try:
-        parsed = phonenumbers.parse(phone_number, None)
+        # Positional None keeps the cache key identical to the validate path
+        parsed = _parse(phone_number, None)
         return phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164)
-    except:
+    except (NumberParseException, ValueError):
         return phone_number
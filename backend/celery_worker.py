@@ -0,0 +1,19 @@
+"""
+Celery worker entrypoint
+
+Builds the Flask app and binds Celery to it (broker URL, result backend
+and the app-context task base) before the worker starts consuming.
+Without this, tasks like persist_analysis would run outside an
+application context and with the default broker instead of Redis.
+
+Run a worker with:
+    celery -A celery_worker.celery worker --loglevel=info
+"""
+
+import os
+
+from app import create_app
+from app.tasks import init_celery
+
+app = create_app(os.getenv('FLASK_ENV') or 'development')
+celery = init_celery(app)
@@ -1,31 +1,83 @@
 import os
 from datetime import timedelta
+from types import MappingProxyType
+
+import orjson
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Shared immutable values, resolved once at import instead of being
+# re-evaluated (env lookups) or re-allocated (timedeltas) per config class
+_REDIS_URL = os.environ.get('REDIS_URL')
+_DATABASE_URI = os.environ.get('DATABASE_URL') or 'sqlite:///osint_fraud.db'
+_JWT_ACCESS_EXPIRES = timedelta(hours=1)
+_JWT_REFRESH_EXPIRES = timedelta(days=30)
+_REPORTS_DIR = os.path.join(os.path.dirname(__file__), 'reports')
+
+
+def _engine_options(database_uri):
+    """
+    Engine tuning for concurrent /analyze (bulk inserts) + /history (scans).
+
+    Derived from the URI actually used by each config class - pool sizing
+    and psycopg2 batch mode only apply on PostgreSQL, and SQLite (the dev
+    and test databases) rejects those arguments.
+    """
+    options = {
+        'pool_pre_ping': True,
+        'pool_recycle': 1800,
+        # orjson for the JSON columns (rich_metadata, evidence, ...) - the
+        # stdlib codec dominated insert time for metadata-heavy analyses
+        'json_serializer': lambda obj: orjson.dumps(obj).decode(),
+        'json_deserializer': orjson.loads,
+    }
+    if database_uri.startswith('postgresql'):
+        options.update({
+            'pool_size': 20,
+            'max_overflow': 40,
+            'executemany_mode': 'values_plus_batch',
+        })
+    return options
+
+
 class Config:
     """Base configuration"""
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-secret-key-change-in-production'
+    AUTO_CREATE_TABLES = False  # production bootstraps schema via migrations
     SQLALCHEMY_TRACK_MODIFICATIONS = False
-    SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or 'sqlite:///osint_fraud.db'
-    
+    SQLALCHEMY_DATABASE_URI = _DATABASE_URI
+
+    SQLALCHEMY_ENGINE_OPTIONS = _engine_options(_DATABASE_URI)
+
     # JWT Configuration
     JWT_SECRET_KEY = os.environ.get('JWT_SECRET_KEY') or 'jwt-secret-key'
-    JWT_ACCESS_TOKEN_EXPIRES = timedelta(hours=1)
-    JWT_REFRESH_TOKEN_EXPIRES = timedelta(days=30)
+    JWT_ACCESS_TOKEN_EXPIRES = _JWT_ACCESS_EXPIRES
+    JWT_REFRESH_TOKEN_EXPIRES = _JWT_REFRESH_EXPIRES
     
     # API Keys
     NUMVERIFY_API_KEY = os.environ.get('NUMVERIFY_API_KEY', '')
     TELEGRAM_API_ID = os.environ.get('TELEGRAM_API_ID', '')
     TELEGRAM_API_HASH = os.environ.get('TELEGRAM_API_HASH', '')
     
-    # Rate Limiting
-    RATELIMIT_STORAGE_URL = os.environ.get('REDIS_URL') or 'redis://localhost:6379'
+    # Rate Limiting - Redis keeps counters shared across workers; the
+    # in-memory fallback is only safe for single-process development
+    RATELIMIT_STORAGE_URI = _REDIS_URL or 'memory://'
+    RATELIMIT_STRATEGY = 'moving-window'
+    RATELIMIT_KEY_PREFIX = 'osint'
+
+    # Analysis Cache (Redis when available, in-process otherwise)
+    CACHE_TYPE = 'RedisCache' if _REDIS_URL else 'SimpleCache'
+    CACHE_REDIS_URL = _REDIS_URL or ''
+    CACHE_DEFAULT_TIMEOUT = 300
+    ANALYSIS_CACHE_TTL = 86400  # 24 hours, matches the re-analysis window
     
     # Celery Configuration
-    CELERY_BROKER_URL = os.environ.get('REDIS_URL') or 'redis://localhost:6379/0'
-    CELERY_RESULT_BACKEND = os.environ.get('REDIS_URL') or 'redis://localhost:6379/0'
+    CELERY_BROKER_URL = _REDIS_URL or 'redis://localhost:6379/0'
+    CELERY_RESULT_BACKEND = _REDIS_URL or 'redis://localhost:6379/0'
+
+    # Persist analyses via the Celery worker instead of on the request path
+    ASYNC_PERSISTENCE = os.environ.get('ASYNC_PERSISTENCE', 'false').lower() in ('1', 'true', 'yes')
     
     # OSINT Settings
     MAX_SOCIAL_SEARCH_DEPTH = 3
@@ -46,13 +98,14 @@ class Config:
     MEDIUM_RISK_THRESHOLD = 40
     
     # Report Settings
-    REPORTS_DIR = os.path.join(os.path.dirname(__file__), 'reports')
+    REPORTS_DIR = _REPORTS_DIR
     MAX_REPORT_AGE_DAYS = 90
 
 class DevelopmentConfig(Config):
     """Development configuration"""
     DEBUG = True
     TESTING = False
+    AUTO_CREATE_TABLES = True
 
 class ProductionConfig(Config):
     """Production configuration"""
@@ -63,10 +116,16 @@ class TestingConfig(Config):
     """Testing configuration"""
     TESTING = True
     SQLALCHEMY_DATABASE_URI = 'sqlite:///test.db'
+    # Re-derive: the inherited options match the base URI, which may be
+    # PostgreSQL while tests run on SQLite
+    SQLALCHEMY_ENGINE_OPTIONS = _engine_options(SQLALCHEMY_DATABASE_URI)
+    AUTO_CREATE_TABLES = True
 
-config = {
+# Read-only registry - create_app only ever looks names up, and the
+# proxy keeps callers from mutating it
+config = MappingProxyType({
     'development': DevelopmentConfig,
     'production': ProductionConfig,
     'testing': TestingConfig,
     'default': DevelopmentConfig
-}
+})
@@ -5,6 +5,7 @@ Run this to check if your API keys are working correctly
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -20,101 +21,109 @@ from app.services.osint_modules_real import (
     SpamDatabaseChecker
 )
 
+# Each test returns (status, log_text). The tests run concurrently, so
+# they buffer their output instead of printing - otherwise the four
+# probes would interleave on stdout.
+
 def test_ipqualityscore():
     """Test IPQualityScore API"""
-    print("\n" + "="*50)
-    print("Testing IPQualityScore API...")
-    print("="*50)
-    
+    lines = []
+    lines.append("\n" + "="*50)
+    lines.append("Testing IPQualityScore API...")
+    lines.append("="*50)
+
     api_key = os.getenv('IPQUALITYSCORE_API_KEY')
     if not api_key:
-        print("❌ IPQUALITYSCORE_API_KEY not found in .env file")
-        print("   Sign up at: https://www.ipqualityscore.com/create-account")
-        return False
-    
+        lines.append("❌ IPQUALITYSCORE_API_KEY not found in .env file")
+        lines.append("   Sign up at: https://www.ipqualityscore.com/create-account")
+        return False, "\n".join(lines)
+
     checker = IPQualityScoreChecker("+14158586273")  # Test with Google's number
     result = checker.check_fraud()
-    
+
     if result.get('error'):
-        print(f"❌ Error: {result['error']}")
-        return False
-    
-    print("✅ IPQualityScore API is working!")
-    print(f"   Fraud Score: {result.get('fraud_score', 0)}/100")
-    print(f"   Carrier: {result.get('carrier', 'Unknown')}")
-    print(f"   Line Type: {result.get('line_type', 'Unknown')}")
-    print(f"   Country: {result.get('country', 'Unknown')}")
-    print(f"   Active: {result.get('active', False)}")
-    return True
+        lines.append(f"❌ Error: {result['error']}")
+        return False, "\n".join(lines)
+
+    lines.append("✅ IPQualityScore API is working!")
+    lines.append(f"   Fraud Score: {result.get('fraud_score', 0)}/100")
+    lines.append(f"   Carrier: {result.get('carrier', 'Unknown')}")
+    lines.append(f"   Line Type: {result.get('line_type', 'Unknown')}")
+    lines.append(f"   Country: {result.get('country', 'Unknown')}")
+    lines.append(f"   Active: {result.get('active', False)}")
+    return True, "\n".join(lines)
 
 def test_numverify():
     """Test Numverify API"""
-    print("\n" + "="*50)
-    print("Testing Numverify API...")
-    print("="*50)
-    
+    lines = []
+    lines.append("\n" + "="*50)
+    lines.append("Testing Numverify API...")
+    lines.append("="*50)
+
     api_key = os.getenv('NUMVERIFY_API_KEY')
     if not api_key:
-        print("⚠️  NUMVERIFY_API_KEY not found in .env file")
-        print("   Sign up at: https://numverify.com/product")
-        print("   (Optional - IPQualityScore can replace this)")
-        return False
-    
+        lines.append("⚠️  NUMVERIFY_API_KEY not found in .env file")
+        lines.append("   Sign up at: https://numverify.com/product")
+        lines.append("   (Optional - IPQualityScore can replace this)")
+        return False, "\n".join(lines)
+
     validator = NumverifyValidator("+14158586273")
     result = validator.validate()
-    
+
     if result.get('error'):
-        print(f"❌ Error: {result['error']}")
-        return False
-    
-    print("✅ Numverify API is working!")
-    print(f"   Number: {result.get('number', '')}")
-    print(f"   Carrier: {result.get('carrier', 'Unknown')}")
-    print(f"   Country: {result.get('country_name', 'Unknown')}")
-    print(f"   Line Type: {result.get('line_type', 'Unknown')}")
-    return True
+        lines.append(f"❌ Error: {result['error']}")
+        return False, "\n".join(lines)
+
+    lines.append("✅ Numverify API is working!")
+    lines.append(f"   Number: {result.get('number', '')}")
+    lines.append(f"   Carrier: {result.get('carrier', 'Unknown')}")
+    lines.append(f"   Country: {result.get('country_name', 'Unknown')}")
+    lines.append(f"   Line Type: {result.get('line_type', 'Unknown')}")
+    return True, "\n".join(lines)
 
 def test_abstract():
     """Test Abstract API"""
-    print("\n" + "="*50)
-    print("Testing Abstract API...")
-    print("="*50)
-    
+    lines = []
+    lines.append("\n" + "="*50)
+    lines.append("Testing Abstract API...")
+    lines.append("="*50)
+
     api_key = os.getenv('ABSTRACT_API_KEY')
     if not api_key:
-        print("⚠️  ABSTRACT_API_KEY not found in .env file")
-        print("   Sign up at: https://www.abstractapi.com/phone-validation-api")
-        print("   (Optional - IPQualityScore can replace this)")
-        return False
-    
+        lines.append("⚠️  ABSTRACT_API_KEY not found in .env file")
+        lines.append("   Sign up at: https://www.abstractapi.com/phone-validation-api")
+        lines.append("   (Optional - IPQualityScore can replace this)")
+        return False, "\n".join(lines)
+
     validator = AbstractPhoneValidator("+14158586273")
     result = validator.validate()
-    
+
     if result.get('error'):
-        print(f"❌ Error: {result['error']}")
-        return False
-    
-    print("✅ Abstract API is working!")
-    print(f"   Number: {result.get('format', {}).get('international', '')}")
-    print(f"   Carrier: {result.get('carrier', 'Unknown')}")
-    print(f"   Country: {result.get('country', {}).get('name', 'Unknown')}")
-    print(f"   Type: {result.get('type', 'Unknown')}")
-    return True
+        lines.append(f"❌ Error: {result['error']}")
+        return False, "\n".join(lines)
+
+    lines.append("✅ Abstract API is working!")
+    lines.append(f"   Number: {result.get('format', {}).get('international', '')}")
+    lines.append(f"   Carrier: {result.get('carrier', 'Unknown')}")
+    lines.append(f"   Country: {result.get('country', {}).get('name', 'Unknown')}")
+    lines.append(f"   Type: {result.get('type', 'Unknown')}")
+    return True, "\n".join(lines)
 
 def test_spam_checker():
     """Test spam database integration"""
-    print("\n" + "="*50)
-    print("Testing Spam Database Checker...")
-    print("="*50)
-    
+    lines = []
+    lines.append("\n" + "="*50)
+    lines.append("Testing Spam Database Checker...")
+    lines.append("="*50)
+
     checker = SpamDatabaseChecker("+14158586273")
     result = checker.check()
-    
-    print("✅ Spam checker is working!")
-    print(f"   Total Reports: {result.get('total_reports', 0)}")
-    print(f"   Sources: {', '.join(result.get('sources', ['None']))}")
-    print(f"   Categories: {', '.join(result.get('categories', ['None']))}")
-    return True
+
+    lines.append("✅ Spam checker is working!")
+    lines.append(f"   Total Reports: {result.get('total_reports', 0)}")
+    lines.append(f"   Sources: {', '.join(result.get('sources', ['None']))}")
+    lines.append(f"   Categories: {', '.join(result.get('categories', ['None']))}")
+    return True, "\n".join(lines)
 
 def main():
     """Run all API tests"""
@@ -122,35 +131,48 @@ def main():
     print("🔍 OSINT API Configuration Test")
     print("="*60)
     print("\nThis will test your API keys and verify they're working.\n")
-    
+
     # Check if .env file exists
     if not os.path.exists('.env'):
         print("❌ Error: .env file not found in backend directory")
         print("   Please create a .env file with your API keys")
         print("   See API_SETUP_GUIDE.md for instructions")
         return
-    
-    results = {
-        'IPQualityScore': test_ipqualityscore(),
-        'Numverify': test_numverify(),
-        'Abstract': test_abstract(),
-        'SpamChecker': test_spam_checker()
-    }
-    
+
+    # The four probes are independent and network-bound, so run them
+    # concurrently - total wall time is the slowest probe instead of the
+    # sum of all four round-trips
+    tests = [
+        ('IPQualityScore', test_ipqualityscore),
+        ('Numverify', test_numverify),
+        ('Abstract', test_abstract),
+        ('SpamChecker', test_spam_checker)
+    ]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = {name: executor.submit(fn) for name, fn in tests}
+        outcomes = {name: future.result() for name, future in futures.items()}
+
+    results = {}
+    for name, _ in tests:
+        status, log_text = outcomes[name]
+        results[name] = status
+        print(log_text)
+
     # Summary
     print("\n" + "="*60)
     print("📊 Test Summary")
     print("="*60)
-    
+
     working = sum(1 for v in results.values() if v)
     total = len(results)
-    
+
     for name, status in results.items():
         status_icon = "✅" if status else "❌"
         print(f"{status_icon} {name}: {'Working' if status else 'Not Configured/Failed'}")
-    
+
     print("\n" + "="*60)
-    
+
     if results['IPQualityScore']:
         print("✅ Core functionality is working!")
         print("   IPQualityScore provides fraud detection and spam checking.")
@@ -162,7 +184,7 @@ def main():
         print("   2. Get your API key from the dashboard")
         print("   3. Add to backend/.env: IPQUALITYSCORE_API_KEY=your_key_here")
         print("   4. Run this test again")
-    
+
     print("\n   See API_SETUP_GUIDE.md for detailed instructions")
     print("="*60 + "\n")
 
@@ -30,14 +30,15 @@ CREATE TABLE IF NOT EXISTS phone_analyses (
     
     -- Timestamps
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    
-    -- Indexes
-    INDEX idx_phone_number (phone_number),
-    INDEX idx_risk_level (risk_level),
-    INDEX idx_analysis_date (analysis_date)
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- Indexes backing history ordering, the 24h re-analysis lookup and search filters
+CREATE INDEX IF NOT EXISTS ix_phone_analyses_date_desc ON phone_analyses (analysis_date DESC);
+CREATE INDEX IF NOT EXISTS ix_phone_analyses_phone_date ON phone_analyses (phone_number, analysis_date);
+CREATE INDEX IF NOT EXISTS ix_phone_analyses_risk_level ON phone_analyses (risk_level);
+CREATE INDEX IF NOT EXISTS idx_phone_number ON phone_analyses (phone_number);
+
 -- Risk Factors Table
 CREATE TABLE IF NOT EXISTS risk_factors (
     id SERIAL PRIMARY KEY,